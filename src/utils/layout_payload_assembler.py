@@ -33,12 +33,21 @@ v4.4: All services alignment complete!
       - Diagram v3.0: diagram_html + mermaid_code (for debugging)
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+# img-tag wrapper for URL-only diagrams (last-resort fallback)
+_DIAGRAM_IMG_TEMPLATE = (
+    '<img src="%s" class="diagram-image" '
+    'style="max-width:100%%;max-height:100%%;" />'
+)
+
+# Pre-formatted two-digit section numbers ("00".."127") for H2-section slides
+_SECTION_NUMBERS = tuple(f"{i:02d}" for i in range(128))
+
 
 @dataclass
 class AssemblyContext:
@@ -74,12 +83,27 @@ class LayoutPayloadAssembler:
     # Layouts that get full-bleed hero content
     FULL_BLEED_LAYOUTS = {"H1-generated", "L29"}
 
+    # Layouts whose content is the title/subtitle plus a fixed set of
+    # passthrough fields; all handled by _assemble_simple
+    SIMPLE_LAYOUT_FIELDS = {
+        # Two charts/diagrams side by side
+        "S3-two-visuals": (
+            "visual_left_html", "visual_right_html",
+            "caption_left", "caption_right",
+        ),
+        # Two columns for comparison
+        "S4-comparison": (
+            "header_left", "header_right",
+            "content_left", "content_right",
+        ),
+    }
+
     def assemble(
         self,
         layout: str,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any],
+        content: Mapping[str, Any],
         branding: Optional[Any] = None,
         context: Optional[AssemblyContext] = None,
         background_color: Optional[str] = None,
@@ -134,21 +158,20 @@ class LayoutPayloadAssembler:
             payload = self._assemble_c4_infographic(slide_title, subtitle, content)
         elif layout in ["V4-infographic-text", "V4"]:
             payload = self._assemble_v4_infographic_text(slide_title, subtitle, content)
-        elif layout == "S3-two-visuals":
-            payload = self._assemble_s3_two_visuals(slide_title, subtitle, content)
-        elif layout == "S4-comparison":
-            payload = self._assemble_s4_comparison(slide_title, subtitle, content)
+        elif layout in self.SIMPLE_LAYOUT_FIELDS:
+            payload = self._assemble_simple(layout, slide_title, subtitle, content)
         elif layout.startswith("X"):
             payload = self._assemble_x_series(layout, slide_title, subtitle, content)
         else:
             # Fallback to L25 for unknown layouts
-            logger.warning(f"Unknown layout '{layout}', falling back to L25 structure")
+            logger.warning("Unknown layout %r, falling back to L25 structure", layout)
             payload = self._assemble_l25(slide_title, subtitle, content, branding, context)
 
         # Add layout to payload
         payload["layout"] = layout
 
-        # Add background fields if provided (slide-level, outside content)
+        # Add background fields if provided (slide-level, outside content).
+        # Handlers return a fresh dict, so it is extended in place.
         if background_color:
             payload["background_color"] = background_color
         if background_image:
@@ -158,7 +181,7 @@ class LayoutPayloadAssembler:
 
     # ==================== Hero Layouts ====================
 
-    def _assemble_hero_generated(self, content: Dict[str, Any]) -> Dict[str, Any]:
+    def _assemble_hero_generated(self, content: Mapping[str, Any]) -> Dict[str, Any]:
         """
         H1-generated, L29: Full-bleed hero with complete HTML.
 
@@ -183,7 +206,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         H1-structured: Structured title slide with editable fields.
@@ -202,7 +225,7 @@ class LayoutPayloadAssembler:
     def _assemble_section_divider(
         self,
         slide_title: Optional[str],
-        content: Dict[str, Any],
+        content: Mapping[str, Any],
         context: AssemblyContext
     ) -> Dict[str, Any]:
         """
@@ -215,7 +238,11 @@ class LayoutPayloadAssembler:
         section_number = content.get("section_number", "")
         if not section_number and context.slide_number > 1:
             # Generate section number based on slide position
-            section_number = f"{context.slide_number - 1:02d}"
+            index = context.slide_number - 1
+            section_number = (
+                _SECTION_NUMBERS[index] if index < len(_SECTION_NUMBERS)
+                else f"{index:02d}"
+            )
 
         return {
             "content": {
@@ -228,7 +255,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any],
+        content: Mapping[str, Any],
         branding: Optional[Any]
     ) -> Dict[str, Any]:
         """
@@ -240,9 +267,11 @@ class LayoutPayloadAssembler:
         contact_info = content.get("contact_info", "")
 
         # If branding has footer text and no contact_info, use footer as contact
-        if not contact_info and branding and hasattr(branding, 'footer'):
-            if branding.footer.text:
-                contact_info = branding.footer.text
+        if not contact_info and branding:
+            footer = getattr(branding, 'footer', None)
+            footer_text = footer.text if footer else None
+            if footer_text:
+                contact_info = footer_text
 
         return {
             "content": {
@@ -258,7 +287,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any],
+        content: Mapping[str, Any],
         branding: Optional[Any],
         context: AssemblyContext
     ) -> Dict[str, Any]:
@@ -296,7 +325,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any],
+        content: Mapping[str, Any],
         branding: Optional[Any]
     ) -> Dict[str, Any]:
         """
@@ -341,7 +370,7 @@ class LayoutPayloadAssembler:
         layout: str,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         I1-I4: Image + text layouts.
@@ -377,7 +406,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         V1-image-text: Image on left, text on right.
@@ -392,7 +421,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         C3-chart: Single chart slide.
@@ -423,7 +452,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         V2-chart-text: Chart on left, text insights on right.
@@ -462,7 +491,7 @@ class LayoutPayloadAssembler:
     def _assemble_l02(
         self,
         slide_title: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         L02: Analytics-native layout with element slots.
@@ -492,7 +521,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         C5-diagram: Single diagram slide.
@@ -517,7 +546,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         V3-diagram-text: Diagram on left, text on right.
@@ -539,7 +568,7 @@ class LayoutPayloadAssembler:
             }
         }
 
-    def _extract_diagram_html(self, content: Dict[str, Any]) -> str:
+    def _extract_diagram_html(self, content: Mapping[str, Any]) -> str:
         """
         Extract diagram HTML with v4.4 preference order.
 
@@ -566,8 +595,7 @@ class LayoutPayloadAssembler:
 
         # URL-based fallback - wrap in img tag
         if content.get("diagram_url"):
-            url = content["diagram_url"]
-            return f'<img src="{url}" class="diagram-image" style="max-width:100%;max-height:100%;" />'
+            return _DIAGRAM_IMG_TEMPLATE % content["diagram_url"]
 
         return ""
 
@@ -577,7 +605,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         C4-infographic: Single infographic slide.
@@ -602,7 +630,7 @@ class LayoutPayloadAssembler:
         self,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         V4-infographic-text: Infographic on left, text on right.
@@ -626,7 +654,7 @@ class LayoutPayloadAssembler:
             }
         }
 
-    def _extract_infographic_html(self, content: Dict[str, Any]) -> str:
+    def _extract_infographic_html(self, content: Mapping[str, Any]) -> str:
         """
         Extract infographic HTML from various field names.
 
@@ -649,57 +677,23 @@ class LayoutPayloadAssembler:
 
     # ==================== Split Layouts ====================
 
-    def _assemble_s3_two_visuals(
-        self,
-        slide_title: Optional[str],
-        subtitle: Optional[str],
-        content: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        S3-two-visuals: Two charts/diagrams side by side.
-
-        Expected content fields:
-        - visual_left_html: Left visual HTML
-        - visual_right_html: Right visual HTML
-        - caption_left: Left caption
-        - caption_right: Right caption
-        """
-        return {
-            "content": {
-                "slide_title": slide_title or "",
-                "subtitle": subtitle or "",
-                "visual_left_html": content.get("visual_left_html", ""),
-                "visual_right_html": content.get("visual_right_html", ""),
-                "caption_left": content.get("caption_left", ""),
-                "caption_right": content.get("caption_right", "")
-            }
-        }
-
-    def _assemble_s4_comparison(
+    def _assemble_simple(
         self,
+        layout: str,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
-        S4-comparison: Two columns for comparison.
+        S3-two-visuals, S4-comparison: Title + fixed set of passthrough fields.
 
-        Expected content fields:
-        - header_left: Left column header
-        - header_right: Right column header
-        - content_left: Left column content
-        - content_right: Right column content
+        Fields are read from content as-is (default "") using the key tuple
+        registered for the layout in SIMPLE_LAYOUT_FIELDS.
         """
-        return {
-            "content": {
-                "slide_title": slide_title or "",
-                "subtitle": subtitle or "",
-                "header_left": content.get("header_left", ""),
-                "header_right": content.get("header_right", ""),
-                "content_left": content.get("content_left", ""),
-                "content_right": content.get("content_right", "")
-            }
-        }
+        fields = {"slide_title": slide_title or "", "subtitle": subtitle or ""}
+        for key in self.SIMPLE_LAYOUT_FIELDS[layout]:
+            fields[key] = content.get(key, "")
+        return {"content": fields}
 
     # ==================== X-Series Dynamic Layouts ====================
 
@@ -708,7 +702,7 @@ class LayoutPayloadAssembler:
         layout: str,
         slide_title: Optional[str],
         subtitle: Optional[str],
-        content: Dict[str, Any]
+        content: Mapping[str, Any]
     ) -> Dict[str, Any]:
         """
         X1-X5: Dynamic zone-based layouts.
@@ -738,7 +732,7 @@ def assemble_layout_payload(
     layout: str,
     slide_title: Optional[str],
     subtitle: Optional[str],
-    content: Dict[str, Any],
+    content: Mapping[str, Any],
     branding: Optional[Any] = None,
     slide_number: int = 1,
     total_slides: int = 1,
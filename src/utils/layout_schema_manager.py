@@ -6,15 +6,315 @@ Single source of truth for layout requirements, schemas, and best use cases.
 Replaces rule-based LayoutMapper with schema-driven architecture.
 """
 
+import hashlib
 import json
 import os
-from typing import Dict, Any, List, Optional
+import re
+import sys
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Callable, Tuple, Mapping
+from collections import OrderedDict
 from pathlib import Path
 from src.models.agents import Slide
 from src.utils.logger import setup_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = setup_logger(__name__)
 
+# Field-spec keys forwarded to Text Service (v3.2 format ownership + constraints),
+# in output order
+_SPEC_KEYS = (
+    'format_type', 'format_owner', 'validation_threshold', 'expected_structure',
+    'max_chars', 'max_words', 'max_lines', 'min_items', 'max_items',
+    'max_chars_per_item', 'type'
+)
+
+# Subset forwarded for fields nested in item_structure/structure
+_NESTED_SPEC_KEYS = (
+    'format_type', 'format_owner', 'validation_threshold', 'expected_structure',
+    'max_chars', 'max_lines'
+)
+
+# Most distinct exclusion sets whose layout prompt is kept per manager
+_FORMAT_CACHE_SIZE = 64
+
+# Path to layout_schemas.json, resolved once at import
+_SCHEMA_PATH = str(
+    (Path(__file__).parent.parent.parent / 'config' / 'deck_builder' / 'layout_schemas.json').resolve()
+)
+
+def _freeze(obj: Any) -> Any:
+    """
+    Recursively convert loaded JSON into read-only views.
+
+    Dicts become MappingProxyType and lists become tuples, so schemas can be
+    shared freely without defensive copies. String keys (field names, spec
+    keys, layout_ids) are interned so lookups can short-circuit on identity.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({
+            (sys.intern(key) if isinstance(key, str) else key): _freeze(value)
+            for key, value in obj.items()
+        })
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+def _thaw(obj: Any) -> Any:
+    """Recursively convert a frozen schema back into plain JSON-compatible dicts/lists."""
+    if isinstance(obj, Mapping):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(item) for item in obj]
+    return obj
+
+
+# Compiled per-layout validator: takes content, returns list of error strings
+ContentValidator = Callable[[Dict[str, Any]], List[str]]
+
+# Compiled per-field check: takes (value, errors), appends violations
+FieldCheck = Callable[[Any, List[str]], None]
+
+
+def _no_check(value: Any, errors: List[str]) -> None:
+    """Field check for schema types with no constraints to enforce."""
+
+
+def _compile_string_check(field_name: str, field_spec: Mapping[str, Any]) -> FieldCheck:
+    """Check for 'string' fields: type and max_chars."""
+    max_chars = field_spec.get('max_chars')
+
+    def check_string(value, errors):
+        if not isinstance(value, str):
+            errors.append(f"Field {field_name} must be string, got {type(value).__name__}")
+        elif max_chars is not None and len(value) > max_chars:
+            errors.append(
+                f"Field {field_name} exceeds max_chars: {len(value)} > {max_chars}"
+            )
+
+    return check_string
+
+
+def _compile_array_check(field_name: str, field_spec: Mapping[str, Any]) -> FieldCheck:
+    """Check for 'array' fields: type, max/min_items and max_chars_per_item."""
+    max_items = field_spec.get('max_items')
+    min_items = field_spec.get('min_items')
+    max_chars_per_item = field_spec.get('max_chars_per_item')
+
+    def check_array(value, errors):
+        if not isinstance(value, list):
+            errors.append(f"Field {field_name} must be array, got {type(value).__name__}")
+            return
+        if max_items is not None and len(value) > max_items:
+            errors.append(
+                f"Field {field_name} exceeds max_items: {len(value)} > {max_items}"
+            )
+        elif min_items is not None and len(value) < min_items:
+            errors.append(
+                f"Field {field_name} below min_items: {len(value)} < {min_items}"
+            )
+
+        # Validate array items
+        if max_chars_per_item is not None:
+            for idx, item in enumerate(value):
+                if isinstance(item, str) and len(item) > max_chars_per_item:
+                    errors.append(
+                        f"Field {field_name}[{idx}] exceeds max_chars_per_item: "
+                        f"{len(item)} > {max_chars_per_item}"
+                    )
+
+    return check_array
+
+
+def _compile_array_of_objects_check(field_name: str, field_spec: Mapping[str, Any]) -> FieldCheck:
+    """Check for 'array_of_objects' fields: type, max_items and item_structure keys."""
+    max_items = field_spec.get('max_items')
+    has_item_structure = 'item_structure' in field_spec
+    # (key, max_chars or None) for each key of the item structure
+    item_keys = tuple(
+        (key, key_spec.get('max_chars'))
+        for key, key_spec in field_spec.get('item_structure', {}).items()
+    )
+
+    def check_array_of_objects(value, errors):
+        if not isinstance(value, list):
+            errors.append(f"Field {field_name} must be array, got {type(value).__name__}")
+            return
+        if max_items is not None and len(value) > max_items:
+            errors.append(
+                f"Field {field_name} exceeds max_items: {len(value)} > {max_items}"
+            )
+
+        # Validate object structure
+        if not has_item_structure:
+            return
+        for idx, item in enumerate(value):
+            if not isinstance(item, dict):
+                errors.append(f"Field {field_name}[{idx}] must be object")
+                continue
+
+            # Check required keys in item structure
+            for key, max_chars in item_keys:
+                if key not in item:
+                    errors.append(f"Field {field_name}[{idx}] missing key: {key}")
+                elif max_chars is not None and isinstance(item[key], str):
+                    if len(item[key]) > max_chars:
+                        errors.append(
+                            f"Field {field_name}[{idx}].{key} exceeds max_chars: "
+                            f"{len(item[key])} > {max_chars}"
+                        )
+
+    return check_array_of_objects
+
+
+def _compile_object_check(field_name: str, field_spec: Mapping[str, Any]) -> FieldCheck:
+    """Check for 'object' fields: type and structure keys."""
+    # (key, max_chars or None) for each key of the object structure
+    structure_keys = tuple(
+        (key, key_spec.get('max_chars') if isinstance(key_spec, Mapping) else None)
+        for key, key_spec in field_spec.get('structure', {}).items()
+    )
+
+    def check_object(value, errors):
+        if not isinstance(value, dict):
+            errors.append(f"Field {field_name} must be object, got {type(value).__name__}")
+            return
+
+        # Validate object structure
+        for key, max_chars in structure_keys:
+            if key not in value:
+                errors.append(f"Field {field_name} missing key: {key}")
+            elif max_chars is not None:
+                if isinstance(value[key], str) and len(value[key]) > max_chars:
+                    errors.append(
+                        f"Field {field_name}.{key} exceeds max_chars: "
+                        f"{len(value[key])} > {max_chars}"
+                    )
+
+    return check_object
+
+
+# Schema field type -> check compiler
+_FIELD_CHECK_COMPILERS: Dict[str, Callable[[str, Mapping[str, Any]], FieldCheck]] = {
+    'string': _compile_string_check,
+    'array': _compile_array_check,
+    'array_of_objects': _compile_array_of_objects_check,
+    'object': _compile_object_check,
+}
+
+
+def _compile_field_check(field_name: str, field_spec: Mapping[str, Any]) -> FieldCheck:
+    """
+    Build a check function for one schema field.
+
+    Constraints (max_chars, max_items, nested keys, ...) are resolved once here
+    and bound into the returned closure, so validation does no schema lookups.
+    The field type picks the compiler from _FIELD_CHECK_COMPILERS; types
+    without constraints get a no-op check.
+
+    Args:
+        field_name: Field name (used in error messages)
+        field_spec: Field specification from content_schema
+
+    Returns:
+        Function (value, errors) that appends any violations to errors
+    """
+    compiler = _FIELD_CHECK_COMPILERS.get(field_spec.get('type'))
+    if compiler is None:
+        return _no_check
+    return compiler(field_name, field_spec)
+
+
+def _compile_content_validator(content_schema: Mapping[str, Any]) -> ContentValidator:
+    """
+    Compile a layout's content_schema into a single validation function.
+
+    Args:
+        content_schema: Content schema from layout
+
+    Returns:
+        Function (content) -> list of error strings (empty if valid)
+    """
+    required_fields = tuple(
+        field_name for field_name, field_spec in content_schema.items()
+        if field_spec.get('required', False)
+    )
+    required_set = frozenset(required_fields)
+    field_checks = {
+        field_name: _compile_field_check(field_name, field_spec)
+        for field_name, field_spec in content_schema.items()
+    }
+    get_check = field_checks.get
+
+    def validate(content: Dict[str, Any]) -> List[str]:
+        # Check required fields (one C-level subset test in the common case,
+        # per-field scan only to report what is missing, in schema order)
+        if content.keys() >= required_set:
+            errors = []
+        else:
+            errors = [
+                f"Missing required field: {field_name}"
+                for field_name in required_fields
+                if field_name not in content
+            ]
+
+        # Check field types and constraints
+        for field_name, field_value in content.items():
+            check = get_check(field_name)
+            if check is None:
+                errors.append(f"Unexpected field: {field_name}")
+                continue
+            check(field_value, errors)
+
+        return errors
+
+    return validate
+
+
+# Compiled validators shared by all manager instances, keyed by
+# (layout_id, schema file hash) so reloading a changed file recompiles;
+# reload_schemas() drops entries for other hashes.
+# Entries are never mutated, so readers need no lock.
+_compiled_validators: Dict[Tuple[str, str], ContentValidator] = {}
+
+
+def _get_compiled_validator(
+    layout_id: str,
+    schema_hash: str,
+    content_schema: Dict[str, Any]
+) -> ContentValidator:
+    """
+    Get the compiled validator for a layout, compiling it on first use.
+
+    Args:
+        layout_id: Layout ID
+        schema_hash: Hash of the schema file the content_schema came from
+        content_schema: Content schema from layout
+
+    Returns:
+        Compiled content validator
+    """
+    key = (layout_id, schema_hash)
+    validator = _compiled_validators.get(key)
+    if validator is None:
+        validator = _compiled_validators.setdefault(
+            key, _compile_content_validator(content_schema)
+        )
+    return validator
+
+
+def _drop_stale_validators(schema_hash: str) -> None:
+    """Remove shared compiled validators built from other schema file versions."""
+    for key in list(_compiled_validators):
+        if key[1] != schema_hash:
+            _compiled_validators.pop(key, None)
+
 
 class LayoutSchemaManager:
     """
@@ -31,28 +331,93 @@ class LayoutSchemaManager:
     def __init__(self):
         """Initialize layout schema manager and load schemas."""
         self.schemas = self._load_schemas()
+        self._build_lookup_tables()
         logger.info(f"LayoutSchemaManager initialized with {len(self.schemas)} layouts")
 
-    def _load_schemas(self) -> Dict[str, Any]:
+    def _load_schemas(self) -> Mapping[str, Any]:
         """
         Load layout schemas from JSON file.
 
         Returns:
-            Dictionary of layout schemas keyed by layout_id
+            Read-only mapping of layout schemas keyed by layout_id
+            (nested dicts/lists frozen to MappingProxyType/tuple)
         """
-        # Get path to layout_schemas.json
-        base_dir = Path(__file__).parent.parent.parent
-        schema_file = base_dir / 'config' / 'deck_builder' / 'layout_schemas.json'
+        try:
+            with open(_SCHEMA_PATH, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Layout schemas file not found: {_SCHEMA_PATH}")
 
-        if not schema_file.exists():
-            raise FileNotFoundError(f"Layout schemas file not found: {schema_file}")
+        # Cheap fingerprint of the file, used as key material for shared caches
+        self._schema_hash = hashlib.blake2b(raw, digest_size=8).hexdigest()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-        with open(schema_file, 'r') as f:
-            data = json.load(f)
+        return _freeze(data['layouts'])
 
-        return data['layouts']
+    def _build_lookup_tables(self):
+        """
+        Precompute per-layout tables derived from the loaded schemas.
 
-    def get_schema(self, layout_id: str) -> Dict[str, Any]:
+        Schemas are immutable after load, so anything derived from them is
+        built once here (and again on reload_schemas) instead of per call.
+        """
+        # Compiled content validators keyed by layout_id
+        self._validators: Dict[str, ContentValidator] = {
+            layout_id: _get_compiled_validator(
+                layout_id, self._schema_hash, schema['content_schema']
+            )
+            for layout_id, schema in self.schemas.items()
+        }
+
+        # Plain (JSON-serializable) content schemas for outgoing requests
+        self._request_schemas: Dict[str, Dict[str, Any]] = {
+            layout_id: _thaw(schema['content_schema'])
+            for layout_id, schema in self.schemas.items()
+        }
+
+        # Text Service field specifications keyed by layout_id
+        self._field_specs: Dict[str, Dict[str, Any]] = {
+            layout_id: self._extract_field_specifications(schema['content_schema'])
+            for layout_id, schema in self.schemas.items()
+        }
+
+        # Lowercased keyword text per layout for substring matching
+        self._keyword_text: Dict[str, str] = {
+            layout_id: ' '.join(schema.get('best_for_keywords', [])).lower()
+            for layout_id, schema in self.schemas.items()
+        }
+
+        # Layout summaries for AI selection (get_all_layouts_with_use_cases)
+        self._all_layouts: List[Dict[str, Any]] = [
+            {
+                'layout_id': layout_id,
+                'name': schema['name'],
+                'slide_subtype': schema['slide_subtype'],
+                'best_use_case': schema['best_use_case'],
+                'best_for_keywords': schema['best_for_keywords'],
+                'content_fields': list(schema['content_schema'].keys())
+            }
+            for layout_id, schema in self.schemas.items()
+        ]
+
+        # Per-layout prompt blocks joined by format_layout_options_for_ai
+        self._layout_prompt_fragments: Dict[str, str] = {
+            layout['layout_id']: f"""
+**{layout['layout_id']} - {layout['name']}** ({layout['slide_subtype']})
+Best Use Case: {layout['best_use_case']}
+Keywords: {', '.join(layout['best_for_keywords'][:5])}
+Content Fields: {', '.join(layout['content_fields'])}
+"""
+            for layout in self._all_layouts
+        }
+
+        # format_layout_options_for_ai output keyed by frozenset of excluded IDs
+        # (LRU, since each presentation's used layouts form a new key);
+        # the no-exclusion prompt is pre-warmed
+        self._format_cache: "OrderedDict[frozenset, str]" = OrderedDict()
+        self.format_layout_options_for_ai()
+
+    def get_schema(self, layout_id: str) -> Mapping[str, Any]:
         """
         Get complete schema for a specific layout.
 
@@ -60,7 +425,7 @@ class LayoutSchemaManager:
             layout_id: Layout ID (e.g., "L07")
 
         Returns:
-            Complete layout schema dictionary
+            Complete layout schema (read-only mapping)
 
         Raises:
             ValueError: If layout_id not found
@@ -70,7 +435,7 @@ class LayoutSchemaManager:
 
         return self.schemas[layout_id]
 
-    def get_content_schema(self, layout_id: str) -> Dict[str, Any]:
+    def get_content_schema(self, layout_id: str) -> Mapping[str, Any]:
         """
         Get just the content_schema portion for a layout.
 
@@ -78,7 +443,7 @@ class LayoutSchemaManager:
             layout_id: Layout ID (e.g., "L07")
 
         Returns:
-            Content schema dictionary with field specifications
+            Content schema (read-only mapping) with field specifications
         """
         schema = self.get_schema(layout_id)
         return schema['content_schema']
@@ -87,20 +452,13 @@ class LayoutSchemaManager:
         """
         Get all layouts with their best use cases for AI selection.
 
+        The list is built once at load time and shared between calls;
+        treat it as read-only.
+
         Returns:
             List of layout dictionaries with id, name, best_use_case, keywords
         """
-        layouts = []
-        for layout_id, schema in self.schemas.items():
-            layouts.append({
-                'layout_id': layout_id,
-                'name': schema['name'],
-                'slide_subtype': schema['slide_subtype'],
-                'best_use_case': schema['best_use_case'],
-                'best_for_keywords': schema['best_for_keywords'],
-                'content_fields': list(schema['content_schema'].keys())
-            })
-        return layouts
+        return self._all_layouts
 
     def build_content_request(
         self,
@@ -120,7 +478,6 @@ class LayoutSchemaManager:
             Structured request dictionary for Text Service with format specifications
         """
         schema = self.get_schema(layout_id)
-        content_schema = schema['content_schema']
 
         # Build content guidance from slide
         content_guidance = {
@@ -138,16 +495,17 @@ class LayoutSchemaManager:
         if presentation_context:
             content_guidance['presentation_context'] = presentation_context
 
-        # Extract format specifications for each field (v3.2 format ownership)
+        # Format specifications for each field (v3.2 format ownership),
+        # precomputed at load time and copied so each request owns its dicts.
         # This ensures Text Service knows which fields need plain_text vs html
-        field_specs = self._extract_field_specifications(content_schema)
+        field_specs = _thaw(self._field_specs[layout_id])
 
         # Build structured request
         request = {
             'layout_id': layout_id,
             'layout_name': schema['name'],
             'layout_subtype': schema['slide_subtype'],
-            'layout_schema': content_schema,
+            'layout_schema': self._request_schemas[layout_id],
             'field_specifications': field_specs,  # v3.2: Format ownership specs
             'content_guidance': content_guidance,
             'slide_id': slide.slide_id,
@@ -172,91 +530,30 @@ class LayoutSchemaManager:
         field_specs = {}
 
         for field_name, field_spec in content_schema.items():
-            # Extract format specs for this field
-            spec = {}
-
-            # Core format specifications (v3.2)
-            if 'format_type' in field_spec:
-                spec['format_type'] = field_spec['format_type']
-            if 'format_owner' in field_spec:
-                spec['format_owner'] = field_spec['format_owner']
-            if 'validation_threshold' in field_spec:
-                spec['validation_threshold'] = field_spec['validation_threshold']
-            if 'expected_structure' in field_spec:
-                spec['expected_structure'] = field_spec['expected_structure']
-
-            # Include constraints for validation
-            if 'max_chars' in field_spec:
-                spec['max_chars'] = field_spec['max_chars']
-            if 'max_words' in field_spec:
-                spec['max_words'] = field_spec['max_words']
-            if 'max_lines' in field_spec:
-                spec['max_lines'] = field_spec['max_lines']
-            if 'min_items' in field_spec:
-                spec['min_items'] = field_spec['min_items']
-            if 'max_items' in field_spec:
-                spec['max_items'] = field_spec['max_items']
-            if 'max_chars_per_item' in field_spec:
-                spec['max_chars_per_item'] = field_spec['max_chars_per_item']
-
-            # Include field type for context
-            if 'type' in field_spec:
-                spec['type'] = field_spec['type']
+            # Extract format specs and constraints for this field
+            spec = {key: field_spec[key] for key in _SPEC_KEYS if key in field_spec}
 
             # Add to field_specs if we found format specifications
             if spec:
                 field_specs[field_name] = spec
 
-            # Handle nested structures (array_of_objects, objects)
-            if 'item_structure' in field_spec:
-                # array_of_objects (e.g., L06 numbered_items, L19 metrics)
-                nested_specs = {}
-                for nested_field, nested_spec in field_spec['item_structure'].items():
-                    nested_field_spec = {}
-
-                    if 'format_type' in nested_spec:
-                        nested_field_spec['format_type'] = nested_spec['format_type']
-                    if 'format_owner' in nested_spec:
-                        nested_field_spec['format_owner'] = nested_spec['format_owner']
-                    if 'validation_threshold' in nested_spec:
-                        nested_field_spec['validation_threshold'] = nested_spec['validation_threshold']
-                    if 'expected_structure' in nested_spec:
-                        nested_field_spec['expected_structure'] = nested_spec['expected_structure']
-                    if 'max_chars' in nested_spec:
-                        nested_field_spec['max_chars'] = nested_spec['max_chars']
-                    if 'max_lines' in nested_spec:
-                        nested_field_spec['max_lines'] = nested_spec['max_lines']
-
-                    if nested_field_spec:
-                        nested_specs[nested_field] = nested_field_spec
+            # Handle nested structures:
+            # item_structure - array_of_objects (e.g., L06 numbered_items, L19 metrics)
+            # structure      - object (e.g., L20 left_content/right_content)
+            for nested_key in ('item_structure', 'structure'):
+                if nested_key not in field_spec:
+                    continue
 
-                if nested_specs:
-                    field_specs[field_name]['item_structure'] = nested_specs
-
-            if 'structure' in field_spec:
-                # object (e.g., L20 left_content/right_content)
                 nested_specs = {}
-                for nested_field, nested_spec in field_spec['structure'].items():
-                    nested_field_spec = {}
-
-                    if 'format_type' in nested_spec:
-                        nested_field_spec['format_type'] = nested_spec['format_type']
-                    if 'format_owner' in nested_spec:
-                        nested_field_spec['format_owner'] = nested_spec['format_owner']
-                    if 'validation_threshold' in nested_spec:
-                        nested_field_spec['validation_threshold'] = nested_spec['validation_threshold']
-                    if 'expected_structure' in nested_spec:
-                        nested_field_spec['expected_structure'] = nested_spec['expected_structure']
-                    if 'max_chars' in nested_spec:
-                        nested_field_spec['max_chars'] = nested_spec['max_chars']
-                    if 'max_lines' in nested_spec:
-                        nested_field_spec['max_lines'] = nested_spec['max_lines']
-
+                for nested_field, nested_spec in field_spec[nested_key].items():
+                    nested_field_spec = {
+                        key: nested_spec[key] for key in _NESTED_SPEC_KEYS if key in nested_spec
+                    }
                     if nested_field_spec:
                         nested_specs[nested_field] = nested_field_spec
 
                 if nested_specs:
-                    field_specs[field_name]['structure'] = nested_specs
+                    field_specs[field_name][nested_key] = nested_specs
 
         return field_specs
 
@@ -271,96 +568,11 @@ class LayoutSchemaManager:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        schema = self.get_content_schema(layout_id)
-        errors = []
-
-        # Check required fields
-        for field_name, field_spec in schema.items():
-            if field_spec.get('required', False) and field_name not in content:
-                errors.append(f"Missing required field: {field_name}")
-
-        # Check field types and constraints
-        for field_name, field_value in content.items():
-            if field_name not in schema:
-                errors.append(f"Unexpected field: {field_name}")
-                continue
-
-            field_spec = schema[field_name]
-            field_type = field_spec['type']
-
-            # Type validation
-            if field_type == 'string':
-                if not isinstance(field_value, str):
-                    errors.append(f"Field {field_name} must be string, got {type(field_value).__name__}")
-                elif 'max_chars' in field_spec and len(field_value) > field_spec['max_chars']:
-                    errors.append(
-                        f"Field {field_name} exceeds max_chars: {len(field_value)} > {field_spec['max_chars']}"
-                    )
-
-            elif field_type == 'array':
-                if not isinstance(field_value, list):
-                    errors.append(f"Field {field_name} must be array, got {type(field_value).__name__}")
-                elif 'max_items' in field_spec and len(field_value) > field_spec['max_items']:
-                    errors.append(
-                        f"Field {field_name} exceeds max_items: {len(field_value)} > {field_spec['max_items']}"
-                    )
-                elif 'min_items' in field_spec and len(field_value) < field_spec['min_items']:
-                    errors.append(
-                        f"Field {field_name} below min_items: {len(field_value)} < {field_spec['min_items']}"
-                    )
-
-                # Validate array items
-                if isinstance(field_value, list) and 'max_chars_per_item' in field_spec:
-                    for idx, item in enumerate(field_value):
-                        if isinstance(item, str) and len(item) > field_spec['max_chars_per_item']:
-                            errors.append(
-                                f"Field {field_name}[{idx}] exceeds max_chars_per_item: "
-                                f"{len(item)} > {field_spec['max_chars_per_item']}"
-                            )
-
-            elif field_type == 'array_of_objects':
-                if not isinstance(field_value, list):
-                    errors.append(f"Field {field_name} must be array, got {type(field_value).__name__}")
-                elif 'max_items' in field_spec and len(field_value) > field_spec['max_items']:
-                    errors.append(
-                        f"Field {field_name} exceeds max_items: {len(field_value)} > {field_spec['max_items']}"
-                    )
+        validator = self._validators.get(layout_id)
+        if validator is None:
+            raise ValueError(f"Unknown layout ID: {layout_id}")
 
-                # Validate object structure
-                if isinstance(field_value, list) and 'item_structure' in field_spec:
-                    item_structure = field_spec['item_structure']
-                    for idx, item in enumerate(field_value):
-                        if not isinstance(item, dict):
-                            errors.append(f"Field {field_name}[{idx}] must be object")
-                            continue
-
-                        # Check required keys in item structure
-                        for key, key_spec in item_structure.items():
-                            if key not in item:
-                                errors.append(f"Field {field_name}[{idx}] missing key: {key}")
-                            elif 'max_chars' in key_spec and isinstance(item[key], str):
-                                if len(item[key]) > key_spec['max_chars']:
-                                    errors.append(
-                                        f"Field {field_name}[{idx}].{key} exceeds max_chars: "
-                                        f"{len(item[key])} > {key_spec['max_chars']}"
-                                    )
-
-            elif field_type == 'object':
-                if not isinstance(field_value, dict):
-                    errors.append(f"Field {field_name} must be object, got {type(field_value).__name__}")
-
-                # Validate object structure
-                if isinstance(field_value, dict) and 'structure' in field_spec:
-                    structure = field_spec['structure']
-                    for key, key_spec in structure.items():
-                        if key not in field_value:
-                            errors.append(f"Field {field_name} missing key: {key}")
-                        elif isinstance(key_spec, dict) and 'max_chars' in key_spec:
-                            if isinstance(field_value[key], str) and len(field_value[key]) > key_spec['max_chars']:
-                                errors.append(
-                                    f"Field {field_name}.{key} exceeds max_chars: "
-                                    f"{len(field_value[key])} > {key_spec['max_chars']}"
-                                )
+        errors = validator(content)
 
         is_valid = len(errors) == 0
         return is_valid, errors
@@ -369,28 +581,33 @@ class LayoutSchemaManager:
         """
         Format all layout options as text for AI selection prompt.
 
+        Output is cached per set of excluded layout IDs (the most recent
+        _FORMAT_CACHE_SIZE sets); the cache is rebuilt by reload_schemas().
+
         Args:
             exclude_layout_ids: Optional list of layout IDs to exclude (e.g., ["L01", "L02", "L03"])
 
         Returns:
             Formatted string describing all available layouts
         """
-        layouts = self.get_all_layouts_with_use_cases()
+        # Normalize once: O(1) membership for filtering, and the cache key
+        exclude = frozenset(exclude_layout_ids) if exclude_layout_ids else frozenset()
+        cached = self._format_cache.get(exclude)
+        if cached is not None:
+            self._format_cache.move_to_end(exclude)
+            return cached
 
-        # Filter out excluded layouts
-        if exclude_layout_ids:
-            layouts = [l for l in layouts if l['layout_id'] not in exclude_layout_ids]
+        layout_ids = self._layout_prompt_fragments.keys()
 
-        formatted_lines = []
-        for layout in layouts:
-            formatted_lines.append(f"""
-**{layout['layout_id']} - {layout['name']}** ({layout['slide_subtype']})
-Best Use Case: {layout['best_use_case']}
-Keywords: {', '.join(layout['best_for_keywords'][:5])}
-Content Fields: {', '.join(layout['content_fields'])}
-""")
+        # Filter out excluded layouts
+        if exclude:
+            layout_ids = [lid for lid in layout_ids if lid not in exclude]
 
-        return '\n'.join(formatted_lines)
+        formatted = '\n'.join(self._layout_prompt_fragments[lid] for lid in layout_ids)
+        self._format_cache[exclude] = formatted
+        if len(self._format_cache) > _FORMAT_CACHE_SIZE:
+            self._format_cache.popitem(last=False)
+        return formatted
 
     def get_layout_by_keywords(self, search_terms: List[str]) -> List[str]:
         """
@@ -402,28 +619,33 @@ Content Fields: {', '.join(layout['content_fields'])}
         Returns:
             List of matching layout IDs
         """
-        matching_layouts = []
+        terms = [term.lower() for term in search_terms]
+        if not terms:
+            return []
 
-        for layout_id, schema in self.schemas.items():
-            keywords = schema.get('best_for_keywords', [])
-            keyword_text = ' '.join(keywords).lower()
+        # One alternation over all terms scans each keyword text in a single
+        # regex pass instead of a Python loop per term
+        term_pattern = re.compile('|'.join(map(re.escape, terms)))
 
-            # Check if any search term matches
-            for term in search_terms:
-                if term.lower() in keyword_text:
-                    matching_layouts.append(layout_id)
-                    break
+        matching_layouts = []
+        for layout_id, keyword_text in self._keyword_text.items():
+            if term_pattern.search(keyword_text):
+                matching_layouts.append(layout_id)
 
         return matching_layouts
 
     def reload_schemas(self):
         """Reload schemas from JSON file (for development/testing)."""
         self.schemas = self._load_schemas()
+        self._build_lookup_tables()
+        # Instances keep their own references, so only the shared table shrinks
+        _drop_stale_validators(self._schema_hash)
         logger.info(f"Schemas reloaded: {len(self.schemas)} layouts")
 
 
 # Singleton instance for easy access
 _schema_manager_instance = None
+_schema_manager_lock = threading.Lock()
 
 
 def get_schema_manager() -> LayoutSchemaManager:
@@ -435,5 +657,8 @@ def get_schema_manager() -> LayoutSchemaManager:
     """
     global _schema_manager_instance
     if _schema_manager_instance is None:
-        _schema_manager_instance = LayoutSchemaManager()
+        # Double-checked so concurrent first callers load schemas only once
+        with _schema_manager_lock:
+            if _schema_manager_instance is None:
+                _schema_manager_instance = LayoutSchemaManager()
     return _schema_manager_instance
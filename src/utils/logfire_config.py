@@ -2,6 +2,10 @@
 Centralized Logfire configuration for Deckster.
 """
 import os
+
+# Keep Logfire off the console (set before import so it is honoured)
+os.environ.setdefault('LOGFIRE_CONSOLE', 'false')
+
 import logfire
 from typing import Optional
 
@@ -29,24 +33,12 @@ def configure_logfire(force: bool = False) -> bool:
     
     try:
         # Configure with minimal parameters first
-        # Suppress the project URL output by redirecting stdout and stderr temporarily
-        import sys
-        import io
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        sys.stdout = io.StringIO()
-        sys.stderr = io.StringIO()
-        # Also suppress via environment variable if supported
-        os.environ['LOGFIRE_CONSOLE_NO_SHOW'] = '1'
-        try:
-            logfire.configure(
-                service_name="deckster",
-                service_version=os.getenv("APP_VERSION", "dev"),
-                console=False  # Suppress the project URL output
-            )
-        finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
+        logfire.configure(
+            service_name="deckster",
+            service_version=os.getenv("APP_VERSION", "dev"),
+            console=False,  # Suppress the project URL output
+            send_to_logfire='if-token-present'
+        )
         
         # Test with a simple log
         logfire.info("Logfire configured successfully")
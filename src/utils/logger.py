@@ -1,46 +1,69 @@
 """
 Logging configuration for Deckster using Logfire.
 """
+import logging
+import os
+import threading
 from typing import Optional
 
-# Try to configure Logfire once at module import
+# Logfire is configured lazily, on the first setup_logger() call
 LOGFIRE_CONFIGURED = False
+_configure_attempted = False
+_configure_lock = threading.Lock()
+
+
+def _ensure_logfire_configured() -> bool:
+    """
+    Configure Logfire once per process (thread-safe).
+
+    Returns:
+        True if Logfire is configured and should be used
+    """
+    global LOGFIRE_CONFIGURED, _configure_attempted, logfire
+
+    if _configure_attempted:
+        return LOGFIRE_CONFIGURED
+
+    with _configure_lock:
+        if _configure_attempted:
+            return LOGFIRE_CONFIGURED
 
-try:
-    import logfire
-    from config.settings import get_settings
-    
-    settings = get_settings()
-    
-    if settings.LOGFIRE_TOKEN:
         try:
-            # Try to configure Logfire
-            # Suppress the project URL output by redirecting stdout and stderr temporarily
-            import sys
-            import io
-            import os
-            old_stdout = sys.stdout
-            old_stderr = sys.stderr
-            sys.stdout = io.StringIO()
-            sys.stderr = io.StringIO()
-            # Also suppress via environment variable if supported
-            os.environ['LOGFIRE_CONSOLE_NO_SHOW'] = '1'
-            try:
-                logfire.configure(token=settings.LOGFIRE_TOKEN, console=False)
-            finally:
-                sys.stdout = old_stdout
-                sys.stderr = old_stderr
-            LOGFIRE_CONFIGURED = True
-        except Exception as config_error:
-            # Logfire configuration failed, silently disable
+            # Keep Logfire off the console (set before import so it is honoured)
+            os.environ.setdefault('LOGFIRE_CONSOLE', 'false')
+            import logfire
+            from config.settings import get_settings
+
+            settings = get_settings()
+
+            if settings.LOGFIRE_TOKEN:
+                try:
+                    # Try to configure Logfire
+                    logfire.configure(
+                        token=settings.LOGFIRE_TOKEN,
+                        console=False,
+                        send_to_logfire='if-token-present'
+                    )
+                    LOGFIRE_CONFIGURED = True
+                except Exception as config_error:
+                    # Logfire configuration failed, silently disable
+                    LOGFIRE_CONFIGURED = False
+            else:
+                # No LOGFIRE_TOKEN configured, logging disabled
+                LOGFIRE_CONFIGURED = False
+
+        except Exception as e:
+            # Logfire import/setup failed, silently disable
             LOGFIRE_CONFIGURED = False
-    else:
-        # No LOGFIRE_TOKEN configured, logging disabled
-        LOGFIRE_CONFIGURED = False
-        
-except Exception as e:
-    # Logfire import/setup failed, silently disable
-    LOGFIRE_CONFIGURED = False
+
+        _configure_attempted = True
+
+    return LOGFIRE_CONFIGURED
+
+
+# Constant Logfire message templates; name and message go in as structured
+# fields so the backend can group records by template
+_LOG_TEMPLATE = "[{logger_name}] {message}"
 
 
 class LogfireLogger:
@@ -48,41 +71,62 @@ class LogfireLogger:
     
     def __init__(self, name: str):
         self.name = name
+        # Client-side level gate (Logfire itself has none); default keeps everything
+        min_level = logging.getLevelName(os.getenv('LOGFIRE_MIN_LEVEL', 'DEBUG').upper())
+        # getLevelName returns a string for unknown names
+        self._min_level = min_level if isinstance(min_level, int) else logging.DEBUG
     
     def info(self, message, *args, **kwargs):
+        if self._min_level > logging.INFO:
+            return
         # Handle % formatting if args provided
         if args:
             message = message % args
-        logfire.info(f"[{self.name}] {message}", **kwargs)
+        logfire.info(_LOG_TEMPLATE, logger_name=self.name, message=message, **kwargs)
     
     def warn(self, message, *args, **kwargs):
+        if self._min_level > logging.WARNING:
+            return
         if args:
             message = message % args
-        logfire.warn(f"[{self.name}] {message}", **kwargs)
+        logfire.warn(_LOG_TEMPLATE, logger_name=self.name, message=message, **kwargs)
     
     def warning(self, message, *args, **kwargs):
         # Alias for warn
         self.warn(message, *args, **kwargs)
     
     def error(self, message, *args, **kwargs):
+        if self._min_level > logging.ERROR:
+            return
         if args:
             message = message % args
-        logfire.error(f"[{self.name}] {message}", **kwargs)
+        logfire.error(_LOG_TEMPLATE, logger_name=self.name, message=message, **kwargs)
     
     def debug(self, message, *args, **kwargs):
+        if self._min_level > logging.DEBUG:
+            return
         if args:
             message = message % args
-        logfire.debug(f"[{self.name}] {message}", **kwargs)
+        logfire.debug(_LOG_TEMPLATE, logger_name=self.name, message=message, **kwargs)
     
     def critical(self, message, *args, **kwargs):
+        if self._min_level > logging.CRITICAL:
+            return
         if args:
             message = message % args
-        logfire.error(f"[{self.name}] CRITICAL: {message}", **kwargs)
+        # Logfire's fatal level is the equivalent of logging.CRITICAL
+        logfire.fatal(_LOG_TEMPLATE, logger_name=self.name, message=message, **kwargs)
     
     def exception(self, message, *args, **kwargs):
+        if self._min_level > logging.ERROR:
+            return
         if args:
             message = message % args
-        logfire.error(f"[{self.name}] EXCEPTION: {message}", **kwargs)
+        # logfire.exception attaches the active exception (sys.exc_info) natively
+        logfire.exception(_LOG_TEMPLATE, logger_name=self.name, message=message, **kwargs)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        return level >= self._min_level
     
     def setLevel(self, level):
         # No-op for compatibility
@@ -93,8 +137,6 @@ class StandardLogger:
     """Standard Python logger when Logfire is not configured."""
 
     def __init__(self, name: str):
-        import logging
-        import os
         self.logger = logging.getLogger(name)
 
         # Read LOG_LEVEL from environment, default to INFO
@@ -113,26 +155,39 @@ class StandardLogger:
             self.logger.addHandler(handler)
     
     def info(self, message, *args, **kwargs):
-        self.logger.info(message, *args, **{k: v for k, v in kwargs.items() if k != 'exc_info'})
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        kwargs.pop('exc_info', None)
+        self.logger.info(message, *args, **kwargs)
     
     def warn(self, message, *args, **kwargs):
-        self.logger.warning(message, *args, **{k: v for k, v in kwargs.items() if k != 'exc_info'})
+        kwargs.pop('exc_info', None)
+        self.logger.warning(message, *args, **kwargs)
     
     def warning(self, message, *args, **kwargs):
-        self.logger.warning(message, *args, **{k: v for k, v in kwargs.items() if k != 'exc_info'})
+        kwargs.pop('exc_info', None)
+        self.logger.warning(message, *args, **kwargs)
     
     def error(self, message, *args, **kwargs):
         exc_info = kwargs.pop('exc_info', False)
         self.logger.error(message, *args, exc_info=exc_info, **kwargs)
     
     def debug(self, message, *args, **kwargs):
-        self.logger.debug(message, *args, **{k: v for k, v in kwargs.items() if k != 'exc_info'})
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        kwargs.pop('exc_info', None)
+        self.logger.debug(message, *args, **kwargs)
     
     def critical(self, message, *args, **kwargs):
-        self.logger.critical(message, *args, **{k: v for k, v in kwargs.items() if k != 'exc_info'})
+        kwargs.pop('exc_info', None)
+        self.logger.critical(message, *args, **kwargs)
     
     def exception(self, message, *args, **kwargs):
-        self.logger.exception(message, *args, **{k: v for k, v in kwargs.items() if k != 'exc_info'})
+        kwargs.pop('exc_info', None)
+        self.logger.exception(message, *args, **kwargs)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
     
     def setLevel(self, level):
         self.logger.setLevel(level)
@@ -149,11 +204,17 @@ def setup_logger(name: str, level: Optional[str] = None):
     Returns:
         LogfireLogger or StandardLogger instance
     """
-    if LOGFIRE_CONFIGURED:
+    if _ensure_logfire_configured():
         return LogfireLogger(name)
     else:
         return StandardLogger(name)
 
 
-# Create a default logger for the package
-logger = setup_logger(__name__)
\ No newline at end of file
+def __getattr__(name: str):
+    # Default package logger, created on first access so that importing this
+    # module does not configure Logfire
+    global logger
+    if name == 'logger':
+        logger = setup_logger(__name__)
+        return logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
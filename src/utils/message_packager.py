@@ -1,16 +1,197 @@
 """
 Message packaging utilities for frontend communication.
 """
-from uuid import uuid4
+from os import urandom
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from src.models.agents import (
-    ClarifyingQuestions, ConfirmationPlan, PresentationStrawman
-)
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Callable, Tuple, Mapping
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_utcnow = datetime.utcnow
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with the 'Z' suffix the frontend expects."""
+    return f"{_utcnow().isoformat()}Z"
+
+
+# Action buttons are identical for every message of a given kind; the
+# read-only definitions are copied into each message by _actions()
+_CONFIRMATION_PLAN_ACTIONS = (
+    MappingProxyType({
+        "action_id": "accept",
+        "type": "accept_changes",
+        "label": "Accept",
+        "primary": True
+    }),
+    MappingProxyType({
+        "action_id": "reject",
+        "type": "provide_feedback",
+        "label": "Request Changes",
+        "primary": False
+    })
+)
+
+_STRAWMAN_ACTIONS = (
+    MappingProxyType({
+        "action_id": "accept",
+        "type": "accept_changes",
+        "label": "Looks good!",
+        "primary": True
+    }),
+    MappingProxyType({
+        "action_id": "refine",
+        "type": "request_refinement",
+        "label": "Make changes",
+        "primary": False,
+        "requires_input": True
+    })
+)
+
+
+def _actions(definitions: Tuple[Mapping[str, Any], ...]) -> List[Dict[str, Any]]:
+    """Copy action definitions into plain dicts owned by one message."""
+    return [dict(action) for action in definitions]
+
+
+# Key-ordered skeletons for package_progress(); copied per call and filled in
+_PROGRESS_MESSAGE_TEMPLATE = {
+    "id": None,
+    "type": "director_message",
+    "timestamp": None,
+    "session_id": None,
+    "source": "director_inbound",
+    "slide_data": None,
+    "chat_data": None
+}
+
+_PROGRESS_CHAT_TEMPLATE = {
+    "type": "progress",
+    "content": None,
+    "actions": None,
+    "progress": None,
+    "references": None
+}
+
+
+def _slide_to_dict(slide: Any) -> Dict[str, Any]:
+    """Convert a strawman slide into the frontend slide dict."""
+    key_points = slide.key_points
+    return {
+        # Use actual model fields
+        "slide_id": slide.slide_id,
+        "slide_number": slide.slide_number,
+        "slide_type": slide.slide_type,
+        "title": slide.title,
+        "narrative": slide.narrative,
+        "key_points": key_points,
+        
+        # Optional guidance fields
+        "analytics_needed": slide.analytics_needed,
+        "visuals_needed": slide.visuals_needed,
+        "diagrams_needed": slide.diagrams_needed,
+        "structure_preference": slide.structure_preference,
+        "speaker_notes": slide.speaker_notes,
+        
+        # Legacy fields for backward compatibility
+        "subtitle": None,
+        "body_content": [
+            {"type": "text", "content": point}
+            for point in key_points
+        ],
+        "layout_type": "content",  # Default, could be enhanced
+        "animations": [],
+        "transitions": {}
+    }
+
+
+# Per-state packers: each takes the agent response and returns the
+# (slide_data, chat_data) pair for the DirectorMessage
+PackResult = Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def _pack_greeting(response: Any) -> PackResult:
+    chat_data = {
+        "type": "info",
+        "content": response,  # Simple string greeting
+        "actions": None,
+        "progress": None,
+        "references": None
+    }
+    return None, chat_data
+
+
+def _pack_clarifying_questions(response: Any) -> PackResult:
+    # response is ClarifyingQuestions object or dict
+    if hasattr(response, 'questions'):
+        # It's a ClarifyingQuestions object
+        questions = response.questions
+    elif isinstance(response, dict) and 'questions' in response:
+        # It's already a dict
+        questions = response['questions']
+    else:
+        # Fallback - try to extract questions
+        questions = response if isinstance(response, list) else []
+    
+    chat_data = {
+        "type": "question",
+        "content": {"questions": questions},
+        "actions": None
+    }
+    return None, chat_data
+
+
+def _pack_confirmation_plan(response: Any) -> PackResult:
+    # response is ConfirmationPlan object
+    chat_data = {
+        "type": "summary",
+        "content": {
+            "summary_of_user_request": response.summary_of_user_request,
+            "key_assumptions": response.key_assumptions,
+            "proposed_slide_count": response.proposed_slide_count
+        },
+        "actions": _actions(_CONFIRMATION_PLAN_ACTIONS)
+    }
+    return None, chat_data
+
+
+def _pack_strawman(response: Any) -> PackResult:
+    # response is PresentationStrawman object
+    logger.debug("Packaging strawman with %d slides", len(response.slides))
+    logger.debug("Strawman title: %s", response.main_title)
+    slides = [_slide_to_dict(slide) for slide in response.slides]
+    
+    slide_data = {
+        "type": "complete",
+        "slides": slides,
+        "presentation_metadata": {
+            "title": response.main_title,
+            "total_slides": len(response.slides),
+            "theme": response.overall_theme,
+            "design_suggestions": response.design_suggestions,
+            "target_audience": response.target_audience,
+            "presentation_duration": response.presentation_duration
+        }
+    }
+    
+    chat_data = {
+        "type": "info",
+        "content": "Here's your presentation structure. Would you like to make any changes?",
+        "actions": _actions(_STRAWMAN_ACTIONS)
+    }
+    return slide_data, chat_data
+
+
+_STATE_PACKERS: Dict[str, Callable[[Any], PackResult]] = {
+    "PROVIDE_GREETING": _pack_greeting,
+    "ASK_CLARIFYING_QUESTIONS": _pack_clarifying_questions,
+    "CREATE_CONFIRMATION_PLAN": _pack_confirmation_plan,
+    "GENERATE_STRAWMAN": _pack_strawman,
+    "REFINE_STRAWMAN": _pack_strawman,
+}
+
 
 class MessagePackager:
     """Packages agent responses into DirectorMessage format for frontend."""
@@ -21,144 +202,34 @@ class MessagePackager:
         Convert agent response to DirectorMessage format for frontend.
         
         Args:
-            response: Agent response (various types)
+            response: Agent response (various types). Structured responses
+                (ClarifyingQuestions, ConfirmationPlan, PresentationStrawman)
+                are read by attribute only, so any object exposing the same
+                fields (e.g. a slotted dataclass) can be passed.
             session_id: Session ID
             current_state: Current workflow state
             
         Returns:
             DirectorMessage formatted dict
         """
-        base_message = {
-            "id": f"msg_{uuid4().hex[:12]}",
+        # Handle different response types based on state
+        packer = _STATE_PACKERS.get(current_state)
+        if packer is not None:
+            slide_data, chat_data = packer(response)
+        else:
+            slide_data = None
+            chat_data = None
+        
+        logger.debug("Packaged %s response for session %s", current_state, session_id)
+        return {
+            "id": f"msg_{urandom(6).hex()}",
             "type": "director_message",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
             "session_id": session_id,
             "source": "director_inbound",
-            "slide_data": None,
-            "chat_data": None
+            "slide_data": slide_data,
+            "chat_data": chat_data
         }
-        
-        # Handle different response types based on state
-        if current_state == "PROVIDE_GREETING":
-            base_message["chat_data"] = {
-                "type": "info",
-                "content": response,  # Simple string greeting
-                "actions": None,
-                "progress": None,
-                "references": None
-            }
-            
-        elif current_state == "ASK_CLARIFYING_QUESTIONS":
-            # response is ClarifyingQuestions object or dict
-            if hasattr(response, 'questions'):
-                # It's a ClarifyingQuestions object
-                questions = response.questions
-            elif isinstance(response, dict) and 'questions' in response:
-                # It's already a dict
-                questions = response['questions']
-            else:
-                # Fallback - try to extract questions
-                questions = response if isinstance(response, list) else []
-            
-            base_message["chat_data"] = {
-                "type": "question",
-                "content": {"questions": questions},
-                "actions": None
-            }
-            
-        elif current_state == "CREATE_CONFIRMATION_PLAN":
-            # response is ConfirmationPlan object
-            base_message["chat_data"] = {
-                "type": "summary",
-                "content": {
-                    "summary_of_user_request": response.summary_of_user_request,
-                    "key_assumptions": response.key_assumptions,
-                    "proposed_slide_count": response.proposed_slide_count
-                },
-                "actions": [
-                    {
-                        "action_id": "accept",
-                        "type": "accept_changes",
-                        "label": "Accept",
-                        "primary": True
-                    },
-                    {
-                        "action_id": "reject",
-                        "type": "provide_feedback",
-                        "label": "Request Changes",
-                        "primary": False
-                    }
-                ]
-            }
-            
-        elif current_state in ["GENERATE_STRAWMAN", "REFINE_STRAWMAN"]:
-            # response is PresentationStrawman object
-            logger.debug(f"Packaging strawman with {len(response.slides)} slides")
-            logger.debug(f"Strawman title: {response.main_title}")
-            slides = []
-            for slide in response.slides:
-                slides.append({
-                    # Use actual model fields
-                    "slide_id": slide.slide_id,
-                    "slide_number": slide.slide_number,
-                    "slide_type": slide.slide_type,
-                    "title": slide.title,
-                    "narrative": slide.narrative,
-                    "key_points": slide.key_points,
-                    
-                    # Optional guidance fields
-                    "analytics_needed": slide.analytics_needed,
-                    "visuals_needed": slide.visuals_needed,
-                    "diagrams_needed": slide.diagrams_needed,
-                    "structure_preference": slide.structure_preference,
-                    "speaker_notes": slide.speaker_notes,
-                    
-                    # Legacy fields for backward compatibility
-                    "subtitle": None,
-                    "body_content": [
-                        {"type": "text", "content": point}
-                        for point in slide.key_points
-                    ],
-                    "layout_type": "content",  # Default, could be enhanced
-                    "animations": [],
-                    "transitions": {}
-                })
-            
-            base_message["slide_data"] = {
-                "type": "complete",
-                "slides": slides,
-                "presentation_metadata": {
-                    "title": response.main_title,
-                    "total_slides": len(response.slides),
-                    "theme": response.overall_theme,
-                    "design_suggestions": response.design_suggestions,
-                    "target_audience": response.target_audience,
-                    "presentation_duration": response.presentation_duration
-                }
-            }
-            
-            base_message["chat_data"] = {
-                "type": "info",
-                "content": "Here's your presentation structure. Would you like to make any changes?",
-                "actions": [
-                    {
-                        "action_id": "accept",
-                        "type": "accept_changes",
-                        "label": "Looks good!",
-                        "primary": True
-                    },
-                    {
-                        "action_id": "refine",
-                        "type": "request_refinement",
-                        "label": "Make changes",
-                        "primary": False,
-                        "requires_input": True
-                    }
-                ]
-            }
-        
-        logger.debug(f"Packaged {current_state} response for session {session_id}")
-        return base_message
     
     @staticmethod
     def package_error(error: str, session_id: str) -> dict:
@@ -173,9 +244,9 @@ class MessagePackager:
             Error message in DirectorMessage format
         """
         return {
-            "id": f"msg_{uuid4().hex[:12]}",
+            "id": f"msg_{urandom(6).hex()}",
             "type": "director_message",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
             "session_id": session_id,
             "source": "director_inbound",
             "slide_data": None,
@@ -201,21 +272,18 @@ class MessagePackager:
         Returns:
             Progress message in DirectorMessage format
         """
-        return {
-            "id": f"msg_{uuid4().hex[:12]}",
-            "type": "director_message",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "session_id": session_id,
-            "source": "director_inbound",
-            "slide_data": None,
-            "chat_data": {
-                "type": "progress",
-                "content": message,
-                "actions": None,
-                "progress": {
-                    "status": "processing",
-                    "agentStatuses": agent_statuses or {}
-                },
-                "references": None
-            }
-        }
\ No newline at end of file
+        # Progress updates are the most frequent message during agent runs;
+        # cloning the key-ordered templates is cheaper than rebuilding literals
+        chat_data = _PROGRESS_CHAT_TEMPLATE.copy()
+        chat_data["content"] = message
+        chat_data["progress"] = {
+            "status": "processing",
+            "agentStatuses": agent_statuses or {}
+        }
+        
+        msg = _PROGRESS_MESSAGE_TEMPLATE.copy()
+        msg["id"] = f"msg_{urandom(6).hex()}"
+        msg["timestamp"] = _utc_timestamp()
+        msg["session_id"] = session_id
+        msg["chat_data"] = chat_data
+        return msg
\ No newline at end of file
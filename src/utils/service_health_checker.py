@@ -10,12 +10,34 @@ Version: 1.0.0
 Created: 2025-11-29
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable, Final, Mapping
+from collections import Counter
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
 import asyncio
+import json
+import random
+import time
 import aiohttp
-from pydantic import BaseModel, Field
+import yarl
+from src.utils.logger import setup_logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Redis is optional; only RedisHealthSource needs it
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = setup_logger(__name__)
+
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 class ServiceStatus(str, Enum):
@@ -26,29 +48,76 @@ class ServiceStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-class HealthCheckResult(BaseModel):
-    """Result of a health check"""
-    status: ServiceStatus = Field(..., description="Overall service status")
-    service_name: str = Field(..., description="Service name")
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
-    response_time_ms: Optional[float] = Field(None, description="Response time in milliseconds")
+# Summary icon and label per status (read-only, shared by every summary)
+_STATUS_ICONS: Final[Mapping[ServiceStatus, str]] = MappingProxyType({
+    ServiceStatus.HEALTHY: "✅",
+    ServiceStatus.DEGRADED: "⚠️",
+    ServiceStatus.UNHEALTHY: "❌",
+    ServiceStatus.UNKNOWN: "❓"
+})
+
+_STATUS_LABELS: Final[Mapping[ServiceStatus, str]] = MappingProxyType({
+    status: status.value.upper() for status in ServiceStatus
+})
+
+
+def _utc_isoformat() -> str:
+    return datetime.utcnow().isoformat()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HealthCheckResult:
+    """
+    Result of a health check.
+
+    Immutable, so one result can be cached and shared between callers.
+    Use to_dict() to serialize it.
+
+    Attributes:
+        status: Overall service status
+        service_name: Service name
+        timestamp: Check time (UTC, ISO 8601)
+        response_time_ms: Response time in milliseconds
+        is_available: Whether service is reachable
+        is_responsive: Whether service responds quickly
+        error_message: Error message if unhealthy
+        version: Service version
+        uptime_seconds: Service uptime in seconds
+        active_connections: Active connections
+        available_variants: Available variants
+        unavailable_variants: Unavailable variants
+        metrics: Additional metrics
+    """
+    status: ServiceStatus
+    service_name: str
+    timestamp: str = field(default_factory=_utc_isoformat)
+    response_time_ms: Optional[float] = None
 
     # Detailed status
-    is_available: bool = Field(..., description="Whether service is reachable")
-    is_responsive: bool = Field(..., description="Whether service responds quickly")
-    error_message: Optional[str] = Field(None, description="Error message if unhealthy")
+    is_available: bool
+    is_responsive: bool
+    error_message: Optional[str] = None
 
     # Additional info
-    version: Optional[str] = Field(None, description="Service version")
-    uptime_seconds: Optional[float] = Field(None, description="Service uptime in seconds")
-    active_connections: Optional[int] = Field(None, description="Active connections")
+    version: Optional[str] = None
+    uptime_seconds: Optional[float] = None
+    active_connections: Optional[int] = None
 
     # Variant availability
-    available_variants: List[str] = Field(default_factory=list, description="Available variants")
-    unavailable_variants: List[str] = Field(default_factory=list, description="Unavailable variants")
+    available_variants: List[str] = field(default_factory=list)
+    unavailable_variants: List[str] = field(default_factory=list)
 
     # Metrics
-    metrics: Dict[str, Any] = Field(default_factory=dict, description="Additional metrics")
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        # Accept plain status strings, as the former pydantic model did
+        if not isinstance(self.status, ServiceStatus):
+            object.__setattr__(self, "status", ServiceStatus(self.status))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a plain dict"""
+        return asdict(self)
 
     def is_healthy(self) -> bool:
         """Check if service is healthy"""
@@ -60,28 +129,122 @@ class HealthCheckResult(BaseModel):
 
     def get_summary(self) -> str:
         """Get human-readable summary"""
-        icon = {
-            ServiceStatus.HEALTHY: "✅",
-            ServiceStatus.DEGRADED: "⚠️",
-            ServiceStatus.UNHEALTHY: "❌",
-            ServiceStatus.UNKNOWN: "❓"
-        }[self.status]
-
-        summary = f"{icon} {self.service_name}: {self.status.value.upper()}"
+        parts = [f"{_STATUS_ICONS[self.status]} {self.service_name}: {_STATUS_LABELS[self.status]}"]
 
         if self.response_time_ms:
-            summary += f" ({self.response_time_ms:.0f}ms)"
+            parts.append(f" ({self.response_time_ms:.0f}ms)")
 
         if self.error_message:
-            summary += f"\n  Error: {self.error_message}"
+            parts.append(f"\n  Error: {self.error_message}")
 
         if self.available_variants:
-            summary += f"\n  Variants: {len(self.available_variants)} available"
+            parts.append(f"\n  Variants: {len(self.available_variants)} available")
 
         if self.unavailable_variants:
-            summary += f", {len(self.unavailable_variants)} unavailable"
+            parts.append(f", {len(self.unavailable_variants)} unavailable")
 
-        return summary
+        return "".join(parts)
+
+
+def _tally(results: Dict[str, HealthCheckResult]) -> Counter:
+    """Count results per ServiceStatus in a single pass."""
+    return Counter(r.status for r in results.values())
+
+
+def _aggregate_status(tally: Counter, total: int) -> ServiceStatus:
+    """Derive the aggregate status from a per-status tally."""
+    if not total:
+        return ServiceStatus.UNKNOWN
+
+    # If any unhealthy, aggregate is unhealthy
+    if tally[ServiceStatus.UNHEALTHY]:
+        return ServiceStatus.UNHEALTHY
+
+    # If any degraded, aggregate is degraded
+    if tally[ServiceStatus.DEGRADED]:
+        return ServiceStatus.DEGRADED
+
+    # If all healthy, aggregate is healthy
+    if tally[ServiceStatus.HEALTHY] == total:
+        return ServiceStatus.HEALTHY
+
+    return ServiceStatus.UNKNOWN
+
+
+_RESULT_FIELDS = frozenset(f.name for f in fields(HealthCheckResult))
+
+
+class RedisHealthSource:
+    """
+    Reads service heartbeats from Redis instead of probing each service.
+
+    Requires the optional 'redis' package (redis>=4.2, for redis.asyncio),
+    which is not installed by default; see requirements.txt.
+
+    Services publish their own health as a JSON object of HealthCheckResult
+    fields, with an expiry of a few heartbeat intervals:
+
+        redis.set(f"health:{service_name}", json.dumps(payload), ex=interval * 3)
+
+    A missing key means no recent heartbeat. Pass the source to
+    ServiceHealthChecker(heartbeat_source=...) so that it only falls back to
+    an HTTP probe in that case.
+
+    Usage:
+        source = RedisHealthSource("redis://localhost:6379/0")
+        result = await source.get("analytics_service_v3")
+    """
+
+    def __init__(self, redis_url: str, key_prefix: str = "health:"):
+        """
+        Initialize heartbeat source.
+
+        Args:
+            redis_url: Redis connection URL
+            key_prefix: Prefix of the per-service heartbeat keys
+
+        Raises:
+            ImportError: If the redis package is not installed
+        """
+        if aioredis is None:
+            raise ImportError("RedisHealthSource requires the 'redis' package")
+        self.key_prefix = key_prefix
+        self._redis = aioredis.from_url(redis_url)
+
+    async def get(self, service_name: str) -> Optional[HealthCheckResult]:
+        """
+        Get the latest heartbeat of a service.
+
+        Args:
+            service_name: Service identifier
+
+        Returns:
+            HealthCheckResult from the heartbeat, or None if there is no
+            fresh heartbeat or Redis cannot be read
+        """
+        try:
+            raw = await self._redis.get(f"{self.key_prefix}{service_name}")
+            if raw is None:
+                return None
+
+            payload = {
+                key: value for key, value in _json_loads(raw).items()
+                if key in _RESULT_FIELDS
+            }
+            # A live heartbeat implies the service is up unless it says otherwise
+            payload.setdefault("status", ServiceStatus.HEALTHY)
+            payload.setdefault("is_available", True)
+            payload.setdefault("is_responsive", True)
+            payload["service_name"] = service_name
+            return HealthCheckResult(**payload)
+
+        except (aioredis.RedisError, ValueError, TypeError, AttributeError) as e:
+            logger.warning("Unusable heartbeat for %s: %s", service_name, e)
+            return None
+
+    async def aclose(self):
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
 
 
 class ServiceHealthChecker:
@@ -91,6 +254,13 @@ class ServiceHealthChecker:
     Performs health checks by calling service health endpoints and
     analyzing responses to determine service status.
 
+    The checker owns one aiohttp session (created on first use) so repeated
+    probes reuse pooled keep-alive connections; close it with aclose() or use
+    the checker as an async context manager.
+
+    With a heartbeat_source (e.g. RedisHealthSource), a fresh heartbeat is
+    returned as is and the service is only probed over HTTP without one.
+
     Usage:
         checker = ServiceHealthChecker()
 
@@ -109,12 +279,17 @@ class ServiceHealthChecker:
             "analytics_service_v3": "https://analytics.example.com",
             "text_service_v1.2": "https://text.example.com"
         })
+
+        await checker.aclose()
     """
 
     def __init__(
         self,
         timeout_seconds: float = 5.0,
-        slow_threshold_ms: float = 1000.0
+        slow_threshold_ms: float = 1000.0,
+        max_concurrency: int = 50,
+        max_per_host: int = 8,
+        heartbeat_source: Optional[RedisHealthSource] = None
     ):
         """
         Initialize health checker.
@@ -122,9 +297,76 @@ class ServiceHealthChecker:
         Args:
             timeout_seconds: Request timeout in seconds
             slow_threshold_ms: Threshold for considering response slow (degraded)
+            max_concurrency: Maximum health checks in flight at once
+            max_per_host: Maximum health checks in flight per host
+            heartbeat_source: Optional source of published heartbeats
+                (any object with async get(service_name) returning a
+                HealthCheckResult or None), consulted before probing
         """
         self.timeout_seconds = timeout_seconds
         self.slow_threshold_ms = slow_threshold_ms
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self.heartbeat_source = heartbeat_source
+        # Connect phases get a short budget of their own so a stalled
+        # DNS/TCP setup fails fast instead of eating the whole timeout
+        connect_timeout = min(2.0, timeout_seconds)
+        self._timeout = aiohttp.ClientTimeout(
+            total=timeout_seconds,
+            connect=connect_timeout,
+            sock_connect=connect_timeout,
+            sock_read=timeout_seconds
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_semaphores: Dict[Tuple[Optional[str], Optional[int]], asyncio.Semaphore] = {}
+        # (base_url, endpoint) -> parsed URL; aiohttp uses yarl.URL as is
+        self._url_cache: Dict[Tuple[str, str], yarl.URL] = {}
+
+    async def __aenter__(self) -> "ServiceHealthChecker":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        Created lazily so that it binds to the running event loop.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    keepalive_timeout=30,
+                    ttl_dns_cache=300
+                )
+            )
+        return self._session
+
+    def _build_url(self, base_url: str, endpoint: str) -> yarl.URL:
+        """Get the parsed URL for an endpoint, parsing it once per pair."""
+        key = (base_url, endpoint)
+        url = self._url_cache.get(key)
+        if url is None:
+            url = self._url_cache[key] = yarl.URL(f"{base_url.rstrip('/')}{endpoint}")
+        return url
+
+    def _host_semaphore(self, url: yarl.URL) -> asyncio.Semaphore:
+        """Get the concurrency slot pool for the host serving url."""
+        host = (url.raw_host, url.port)
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return semaphore
+
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def check_service(
         self,
@@ -147,61 +389,71 @@ class ServiceHealthChecker:
         Returns:
             HealthCheckResult with status and details
         """
-        start_time = datetime.utcnow()
+        if self.heartbeat_source is not None:
+            heartbeat = await self.heartbeat_source.get(service_name)
+            if heartbeat is not None:
+                return heartbeat
 
         try:
             # Prepare health check URL
-            url = f"{base_url.rstrip('/')}{health_endpoint}"
+            url = self._build_url(base_url, health_endpoint)
+
+            # Make request; the slots bound overall and per-host fan-out, and
+            # timing starts only once they are held
+            async with self._semaphore, self._host_semaphore(url):
+                # Hard per-check bound; also covers DNS resolution and connect
+                async with asyncio.timeout(self.timeout_seconds):
+                    start_ns = time.perf_counter_ns()
+                    response_status, data = await self._get_json(url)
 
-            # Make request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=self.timeout_seconds) as response:
                     # Calculate response time
-                    response_time_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-
-                    # Get response data
-                    try:
-                        data = await response.json()
-                    except:
-                        data = {}
-
-                    # Determine status
-                    is_available = response.status == 200
-                    is_responsive = response_time_ms < self.slow_threshold_ms
-
-                    if is_available and is_responsive:
-                        status = ServiceStatus.HEALTHY
-                    elif is_available:
-                        status = ServiceStatus.DEGRADED  # Slow response
-                    else:
-                        status = ServiceStatus.UNHEALTHY
-
-                    # Extract variant info if requested
-                    available_variants = []
-                    unavailable_variants = []
-
-                    if check_variants and variant_endpoint:
-                        variant_info = await self._check_variants(
-                            base_url,
-                            variant_endpoint,
-                            session
-                        )
-                        available_variants = variant_info.get("available", [])
-                        unavailable_variants = variant_info.get("unavailable", [])
-
-                    return HealthCheckResult(
-                        status=status,
-                        service_name=service_name,
-                        response_time_ms=response_time_ms,
-                        is_available=is_available,
-                        is_responsive=is_responsive,
-                        version=data.get("version"),
-                        uptime_seconds=data.get("uptime"),
-                        active_connections=data.get("active_connections"),
-                        available_variants=available_variants,
-                        unavailable_variants=unavailable_variants,
-                        metrics=data.get("metrics", {})
+                    response_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+                is_available = response_status == 200
+
+                # Determine status
+                is_responsive = response_time_ms < self.slow_threshold_ms
+
+                if is_available and is_responsive:
+                    status = ServiceStatus.HEALTHY
+                elif is_available:
+                    status = ServiceStatus.DEGRADED  # Slow response
+                else:
+                    status = ServiceStatus.UNHEALTHY
+
+                # Extract variant info if requested
+                available_variants = []
+                unavailable_variants = []
+                error_message = None
+
+                if check_variants and variant_endpoint:
+                    variant_info = await self._check_variants(
+                        base_url,
+                        variant_endpoint
                     )
+                    available_variants = variant_info.get("available", [])
+                    unavailable_variants = variant_info.get("unavailable", [])
+
+                    # A reachable service whose variant listing fails is degraded
+                    if "error" in variant_info:
+                        error_message = f"Variant check failed: {variant_info['error']}"
+                        if status == ServiceStatus.HEALTHY:
+                            status = ServiceStatus.DEGRADED
+
+                return HealthCheckResult(
+                    status=status,
+                    service_name=service_name,
+                    response_time_ms=response_time_ms,
+                    is_available=is_available,
+                    is_responsive=is_responsive,
+                    error_message=error_message,
+                    version=data.get("version"),
+                    uptime_seconds=data.get("uptime"),
+                    active_connections=data.get("active_connections"),
+                    available_variants=available_variants,
+                    unavailable_variants=unavailable_variants,
+                    metrics=data.get("metrics", {})
+                )
 
         except asyncio.TimeoutError:
             return HealthCheckResult(
@@ -245,26 +497,60 @@ class ServiceHealthChecker:
         Returns:
             Dict mapping service_name -> HealthCheckResult
         """
-        tasks = []
-
-        for service_name, base_url in services.items():
-            task = self.check_service(service_name, base_url, health_endpoint)
-            tasks.append((service_name, task))
+        # Execute all health checks concurrently (check_service bounds how
+        # many are in flight at once)
+        outcomes = await asyncio.gather(
+            *(
+                self.check_service(service_name, base_url, health_endpoint)
+                for service_name, base_url in services.items()
+            ),
+            return_exceptions=True
+        )
 
         results = {}
 
-        # Execute all health checks concurrently
-        for service_name, task in tasks:
-            result = await task
-            results[service_name] = result
+        for service_name, outcome in zip(services, outcomes):
+            if isinstance(outcome, BaseException):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+                if isinstance(outcome, asyncio.TimeoutError):
+                    error_message = f"Timeout after {self.timeout_seconds}s"
+                else:
+                    error_message = f"Unexpected error: {str(outcome)}"
+                outcome = HealthCheckResult(
+                    status=ServiceStatus.UNHEALTHY,
+                    service_name=service_name,
+                    is_available=False,
+                    is_responsive=False,
+                    error_message=error_message
+                )
+            results[service_name] = outcome
 
         return results
 
+    async def _get_json(self, url: yarl.URL) -> Tuple[int, Any]:
+        """
+        GET a URL on the shared session.
+
+        Args:
+            url: Absolute URL
+
+        Returns:
+            (HTTP status, decoded JSON body or {} if the body is not JSON)
+        """
+        session = await self._get_session()
+        async with session.get(url, timeout=self._timeout) as response:
+            try:
+                data = await response.json(loads=_json_loads)
+            except (aiohttp.ContentTypeError, ValueError):
+                # Not JSON (wrong content type or undecodable body)
+                data = {}
+            return response.status, data
+
     async def _check_variants(
         self,
         base_url: str,
-        variant_endpoint: str,
-        session: aiohttp.ClientSession
+        variant_endpoint: str
     ) -> Dict[str, List[str]]:
         """
         Check variant availability.
@@ -272,38 +558,42 @@ class ServiceHealthChecker:
         Args:
             base_url: Service base URL
             variant_endpoint: Variant listing endpoint
-            session: aiohttp session
 
         Returns:
-            Dict with "available" and "unavailable" variant lists
+            Dict with "available" and "unavailable" variant lists, plus
+            "error" if the variant endpoint could not be reached
         """
-        try:
-            url = f"{base_url.rstrip('/')}{variant_endpoint}"
+        url = self._build_url(base_url, variant_endpoint)
 
-            async with session.get(url, timeout=self.timeout_seconds) as response:
-                if response.status == 200:
-                    data = await response.json()
-
-                    # Extract variants based on metadata format
-                    variants = data.get("variants", {})
-                    if isinstance(variants, dict):
-                        available = []
-                        unavailable = []
-
-                        for variant_id, variant_data in variants.items():
-                            status = variant_data.get("status", "production")
-                            if status in ["production", "beta"]:
-                                available.append(variant_id)
-                            else:
-                                unavailable.append(variant_id)
-
-                        return {
-                            "available": available,
-                            "unavailable": unavailable
-                        }
+        try:
+            async with asyncio.timeout(self.timeout_seconds):
+                response_status, data = await self._get_json(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            reason = str(e) or type(e).__name__
+            logger.warning("Variant check failed for %s: %s", url, reason)
+            return {"available": [], "unavailable": [], "error": reason}
+
+        if response_status == 200 and isinstance(data, dict):
+            # Extract variants based on metadata format
+            variants = data.get("variants", {})
+            if isinstance(variants, dict):
+                available = []
+                unavailable = []
+
+                for variant_id, variant_data in variants.items():
+                    if isinstance(variant_data, dict):
+                        status = variant_data.get("status", "production")
+                    else:
+                        status = None
+                    if status in ["production", "beta"]:
+                        available.append(variant_id)
+                    else:
+                        unavailable.append(variant_id)
 
-        except:
-            pass
+                return {
+                    "available": available,
+                    "unavailable": unavailable
+                }
 
         return {"available": [], "unavailable": []}
 
@@ -320,24 +610,7 @@ class ServiceHealthChecker:
         Returns:
             Aggregate ServiceStatus
         """
-        if not results:
-            return ServiceStatus.UNKNOWN
-
-        statuses = [r.status for r in results.values()]
-
-        # If any unhealthy, aggregate is unhealthy
-        if ServiceStatus.UNHEALTHY in statuses:
-            return ServiceStatus.UNHEALTHY
-
-        # If any degraded, aggregate is degraded
-        if ServiceStatus.DEGRADED in statuses:
-            return ServiceStatus.DEGRADED
-
-        # If all healthy, aggregate is healthy
-        if all(s == ServiceStatus.HEALTHY for s in statuses):
-            return ServiceStatus.HEALTHY
-
-        return ServiceStatus.UNKNOWN
+        return _aggregate_status(_tally(results), len(results))
 
     def get_summary_report(
         self,
@@ -352,7 +625,10 @@ class ServiceHealthChecker:
         Returns:
             Formatted summary report
         """
-        aggregate = self.get_aggregate_status(results)
+        # One pass over the results feeds both the aggregate and the statistics
+        tally = _tally(results)
+        total = len(results)
+        aggregate = _aggregate_status(tally, total)
 
         report_lines = [
             f"Service Health Report ({datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')})",
@@ -365,18 +641,13 @@ class ServiceHealthChecker:
             report_lines.append(f"  {result.get_summary()}")
 
         # Statistics
-        total = len(results)
-        healthy = sum(1 for r in results.values() if r.status == ServiceStatus.HEALTHY)
-        degraded = sum(1 for r in results.values() if r.status == ServiceStatus.DEGRADED)
-        unhealthy = sum(1 for r in results.values() if r.status == ServiceStatus.UNHEALTHY)
-
         report_lines.extend([
             "",
             "Statistics:",
             f"  Total services: {total}",
-            f"  Healthy: {healthy}",
-            f"  Degraded: {degraded}",
-            f"  Unhealthy: {unhealthy}"
+            f"  Healthy: {tally[ServiceStatus.HEALTHY]}",
+            f"  Degraded: {tally[ServiceStatus.DEGRADED]}",
+            f"  Unhealthy: {tally[ServiceStatus.UNHEALTHY]}"
         ])
 
         return "\n".join(report_lines)
@@ -386,6 +657,8 @@ class HealthCheckCache:
     """
     Cache for health check results to avoid excessive checking.
 
+    Concurrent misses for the same service share a single in-flight check.
+
     Usage:
         cache = HealthCheckCache(ttl_seconds=60)
 
@@ -394,6 +667,11 @@ class HealthCheckCache:
             service_name="analytics_service_v3",
             check_func=lambda: checker.check_service(...)
         )
+
+        # Or keep results warm off the request path
+        await cache.start_background_refresh({
+            "analytics_service_v3": lambda: checker.check_service(...)
+        })
     """
 
     def __init__(self, ttl_seconds: float = 60.0):
@@ -404,7 +682,13 @@ class HealthCheckCache:
             ttl_seconds: Time-to-live for cached results
         """
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, tuple[HealthCheckResult, datetime]] = {}
+        # service_name -> (result, time.monotonic() deadline)
+        self._cache: Dict[str, tuple[HealthCheckResult, float]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Background refresh state (see start_background_refresh)
+        self._refresh_funcs: Dict[str, Callable[[], Awaitable[HealthCheckResult]]] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
 
     async def get_or_check(
         self,
@@ -414,6 +698,9 @@ class HealthCheckCache:
         """
         Get cached result or perform new check.
 
+        Services under background refresh return their last known result
+        without checking its age; a check only runs if none exists yet.
+
         Args:
             service_name: Service identifier
             check_func: Async function that performs health check
@@ -422,21 +709,146 @@ class HealthCheckCache:
             HealthCheckResult (cached or fresh)
         """
         # Check cache
-        if service_name in self._cache:
-            result, timestamp = self._cache[service_name]
+        cached = self.peek(service_name)
+        if cached is not None:
+            return cached
+
+        # Cache miss or expired - join the in-flight check or start one.
+        # Shielded so one caller's cancellation does not abort the shared check
+        return await asyncio.shield(self._start_check(service_name, check_func))
+
+    def peek(self, service_name: str) -> Optional[HealthCheckResult]:
+        """
+        Get the cached result without triggering a check.
+
+        Args:
+            service_name: Service identifier
+
+        Returns:
+            Cached HealthCheckResult, or None if missing or expired
+        """
+        entry = self._cache.get(service_name)
+        if entry is not None and (
+            service_name in self._refresh_funcs or time.monotonic() < entry[1]
+        ):
+            return entry[0]
+        return None
+
+    def mark_healthy(self, service_name: str):
+        """
+        Record that a real request to the service just succeeded.
+
+        A fresh healthy result is kept as is, since it carries more detail
+        (version, variants, ...) than this observation.
+
+        Args:
+            service_name: Service identifier
+        """
+        cached = self.peek(service_name)
+        if cached is not None and cached.status == ServiceStatus.HEALTHY:
+            return
+
+        self._cache[service_name] = (
+            HealthCheckResult(
+                status=ServiceStatus.HEALTHY,
+                service_name=service_name,
+                is_available=True,
+                is_responsive=True
+            ),
+            time.monotonic() + self.ttl_seconds
+        )
+
+    def mark_unhealthy(self, service_name: str, error_message: Optional[str] = None):
+        """
+        Record that a real request to the service failed for good.
+
+        Args:
+            service_name: Service identifier
+            error_message: Description of the failure
+        """
+        self._cache[service_name] = (
+            HealthCheckResult(
+                status=ServiceStatus.UNHEALTHY,
+                service_name=service_name,
+                is_available=False,
+                is_responsive=False,
+                error_message=error_message
+            ),
+            time.monotonic() + self.ttl_seconds
+        )
 
-            # Check if still valid
-            age = (datetime.utcnow() - timestamp).total_seconds()
-            if age < self.ttl_seconds:
-                return result
+    def _start_check(self, service_name: str, check_func) -> asyncio.Task:
+        """Get the in-flight check for a service, starting one if needed."""
+        task = self._inflight.get(service_name)
+        if task is None:
+            task = asyncio.ensure_future(self._check_and_store(service_name, check_func))
+            self._inflight[service_name] = task
+        return task
+
+    async def _check_and_store(self, service_name: str, check_func) -> HealthCheckResult:
+        """Run a health check and cache its result."""
+        try:
+            result = await check_func()
 
-        # Cache miss or expired - perform check
-        result = await check_func()
+            # Update cache
+            self._cache[service_name] = (result, time.monotonic() + self.ttl_seconds)
 
-        # Update cache
-        self._cache[service_name] = (result, datetime.utcnow())
+            return result
+        finally:
+            self._inflight.pop(service_name, None)
 
-        return result
+    async def start_background_refresh(
+        self,
+        check_funcs: Dict[str, Callable[[], Awaitable[HealthCheckResult]]],
+        interval_seconds: Optional[float] = None,
+        jitter_seconds: Optional[float] = None
+    ):
+        """
+        Periodically refresh services in the background.
+
+        Checks run immediately and then every interval, with a random offset
+        so that probes from many processes do not line up. A refresh that
+        is already running is stopped first.
+
+        Args:
+            check_funcs: Dict mapping service_name -> async check function
+            interval_seconds: Refresh interval (default: ttl_seconds)
+            jitter_seconds: Maximum random offset per cycle
+                (default: 10% of the interval)
+        """
+        await self.stop_background_refresh()
+
+        interval = self.ttl_seconds if interval_seconds is None else interval_seconds
+        jitter = interval * 0.1 if jitter_seconds is None else jitter_seconds
+
+        self._refresh_funcs = dict(check_funcs)
+        self._refresh_task = asyncio.create_task(self._refresh_loop(interval, jitter))
+
+    async def stop_background_refresh(self):
+        """Stop background refresh; lookups fall back to TTL-based checking."""
+        task, self._refresh_task = self._refresh_task, None
+        self._refresh_funcs = {}
+
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _refresh_loop(self, interval: float, jitter: float):
+        """Refresh every registered service, then sleep a jittered interval."""
+        while True:
+            # A failed refresh keeps the last known result. Shielded so that
+            # stopping the loop does not cancel checks other callers await
+            await asyncio.gather(
+                *(
+                    asyncio.shield(self._start_check(service_name, check_func))
+                    for service_name, check_func in self._refresh_funcs.items()
+                ),
+                return_exceptions=True
+            )
+            await asyncio.sleep(max(0.0, interval + random.uniform(-jitter, jitter)))
 
     def invalidate(self, service_name: Optional[str] = None):
         """
@@ -452,14 +864,13 @@ class HealthCheckCache:
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        now = datetime.utcnow()
+        now = time.monotonic()
 
         valid_count = 0
         expired_count = 0
 
-        for result, timestamp in self._cache.values():
-            age = (now - timestamp).total_seconds()
-            if age < self.ttl_seconds:
+        for result, deadline in self._cache.values():
+            if now < deadline:
                 valid_count += 1
             else:
                 expired_count += 1
@@ -499,5 +910,5 @@ async def check_service_health(
         if result.is_healthy():
             print("Service is healthy!")
     """
-    checker = ServiceHealthChecker(timeout_seconds=timeout_seconds)
-    return await checker.check_service(service_name, base_url, health_endpoint)
+    async with ServiceHealthChecker(timeout_seconds=timeout_seconds) as checker:
+        return await checker.check_service(service_name, base_url, health_endpoint)
@@ -8,12 +8,129 @@ Provides methods for individual specialized endpoints and batch processing.
 
 import httpx
 import asyncio
-from typing import Dict, Any, List, Optional
+import json
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Optional, AsyncIterator
 from src.utils.logger import setup_logger
 from src.utils.service_registry import ServiceRegistry
+from src.utils.service_health_checker import HealthCheckCache, ServiceStatus
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = setup_logger(__name__)
 
+# HTTP/2 needs the optional h2 package; without it the client speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Upper bound for any single retry sleep, including server-requested ones
+MAX_BACKOFF_SECONDS = 60.0
+
+# Statuses after which the server asks clients to slow down
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+# Request bodies are encoded up front and sent as raw content
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(payload: Any) -> bytes:
+    """Encode a request body as UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    """Client errors are permanent, except request timeout (408) and rate limiting (429)."""
+    return not (400 <= status_code < 500) or status_code in (408, 429)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Delay in seconds, or None if absent/unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_stream_line(line: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse one line of a streamed batch response.
+
+    Accepts SSE ("data: {...}") and NDJSON ("{...}") framing; other SSE
+    fields, comments, blank lines and the "[DONE]" sentinel yield None.
+
+    Args:
+        line: Response line without trailing newline
+
+    Returns:
+        Decoded item, or None if the line carries no item
+    """
+    if line.startswith("data:"):
+        payload = line[5:].strip()
+        if not payload or payload == "[DONE]":
+            return None
+        return _json_loads(payload)
+
+    line = line.strip()
+    if not line.startswith("{"):
+        # Blank keep-alive, ":" comment or event:/id:/retry: field
+        return None
+    return _json_loads(line)
+
+
+def _error_body(response: httpx.Response) -> str:
+    """Error response body for logging; decoded only when DEBUG logging is on."""
+    if logger.isEnabledFor(logging.DEBUG):
+        return response.text
+    return "<suppressed>"
+
+
+def _backoff_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Delay before the next retry.
+
+    Honors Retry-After on throttling responses; otherwise exponential
+    backoff with full jitter so concurrent callers do not retry in lockstep.
+
+    Args:
+        attempt: Attempt number that just failed (1-based)
+        response: Failed response, if the server answered
+
+    Returns:
+        Delay in seconds (at most MAX_BACKOFF_SECONDS)
+    """
+    if response is not None and response.status_code in _THROTTLE_STATUSES:
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, MAX_BACKOFF_SECONDS)
+    return random.uniform(0, min(MAX_BACKOFF_SECONDS, 2 ** attempt))
+
 
 class TextServiceInterface:
     """
@@ -22,12 +139,22 @@ class TextServiceInterface:
     Features:
     - Individual specialized endpoint calls
     - Batch endpoint for parallel processing
+    - Bounded concurrent fan-out over individual endpoints
     - Automatic retries on failures
+    - Fast failure while a shared health cache marks the service unhealthy
     - Comprehensive error handling
     - Request/response validation
     """
 
-    def __init__(self, base_url: str, timeout: int = 300, max_retries: int = 3):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 300,
+        max_retries: int = 3,
+        max_concurrency: int = 20,
+        health_cache: Optional[HealthCheckCache] = None,
+        overall_budget_seconds: Optional[float] = None
+    ):
         """
         Initialize Text Service interface.
 
@@ -35,17 +162,103 @@ class TextServiceInterface:
             base_url: Text Service base URL (e.g., "https://text-service.railway.app")
             timeout: Request timeout in seconds (default: 300 for long generations)
             max_retries: Maximum retry attempts (default: 3)
+            max_concurrency: Maximum concurrent requests in generate_many (default: 20)
+            health_cache: Optional HealthCheckCache shared with the health
+                checker, keyed by base URL. While it holds a fresh UNHEALTHY
+                result, calls fail immediately instead of retrying.
+            overall_budget_seconds: Wall-clock limit for one call including
+                all retries and backoff sleeps (default: timeout * 2**max_retries)
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
-        self.client = httpx.AsyncClient(timeout=timeout)
-        logger.info(f"TextServiceInterface initialized: {base_url}")
+        self.max_concurrency = max_concurrency
+        if overall_budget_seconds is None:
+            overall_budget_seconds = timeout * (2 ** max_retries)
+        self.overall_budget_seconds = overall_budget_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.health_cache = health_cache
+        # Full endpoint URLs, resolved through ServiceRegistry on first use
+        self._urls: Dict[str, str] = {}
+        self._batch_url: Optional[str] = None
+        # One pooled client for the service: HTTP/2 multiplexes concurrent
+        # requests over a single connection where the server supports it
+        # (negotiated via ALPN; plain http:// stays on HTTP/1.1)
+        self.client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            )
+        )
+        logger.info("TextServiceInterface initialized: %s", base_url)
 
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
 
+    def _endpoint_url(self, slide_type_classification: str) -> str:
+        """
+        Get the full specialized endpoint URL for a slide type.
+
+        Raises:
+            ValueError: If slide_type_classification is invalid
+        """
+        url = self._urls.get(slide_type_classification)
+        if url is None:
+            endpoint = ServiceRegistry.get_endpoint(slide_type_classification)
+            if not endpoint:
+                raise ValueError(
+                    f"Invalid slide_type_classification: '{slide_type_classification}'. "
+                    f"Valid types: {ServiceRegistry.get_supported_types()}"
+                )
+            url = self._urls[slide_type_classification] = f"{self.base_url}{endpoint}"
+        return url
+
+    def _get_batch_url(self) -> str:
+        """Get the full batch endpoint URL."""
+        if self._batch_url is None:
+            self._batch_url = f"{self.base_url}{ServiceRegistry.get_batch_endpoint()}"
+        return self._batch_url
+
+    def _ensure_available(self):
+        """
+        Fail fast if the health cache has a fresh UNHEALTHY result.
+
+        Raises:
+            TextServiceUnavailableError: If the service is known to be down
+        """
+        if self.health_cache is None:
+            return
+        cached = self.health_cache.peek(self.base_url)
+        if cached is not None and cached.status == ServiceStatus.UNHEALTHY:
+            raise TextServiceUnavailableError(
+                f"Text Service at {self.base_url} is unhealthy: "
+                f"{cached.error_message or 'recent health check failed'}"
+            )
+
+    def _record_success(self):
+        """Record a successful call in the health cache."""
+        if self.health_cache is not None:
+            self.health_cache.mark_healthy(self.base_url)
+
+    def _record_failure(self, error: Any):
+        """
+        Record a call that failed after all retries in the health cache.
+
+        Only connection failures and 5xx responses mark the service
+        unhealthy; errors specific to one request (4xx, undecodable body,
+        exhausted overall budget) would otherwise fail every sibling call.
+        """
+        if self.health_cache is None:
+            return
+        if isinstance(error, (httpx.NetworkError, httpx.ConnectTimeout)) or (
+            isinstance(error, httpx.HTTPStatusError) and error.response.status_code >= 500
+        ):
+            self.health_cache.mark_unhealthy(self.base_url, str(error))
+
     async def generate_specialized(
         self,
         slide_type_classification: str,
@@ -63,67 +276,78 @@ class TextServiceInterface:
 
         Raises:
             ValueError: If slide_type_classification is invalid
+            TextServiceUnavailableError: If the health cache marks the service unhealthy
             Exception: If API call fails after retries
         """
-        # Get endpoint for slide type
-        endpoint = ServiceRegistry.get_endpoint(slide_type_classification)
-        if not endpoint:
-            raise ValueError(
-                f"Invalid slide_type_classification: '{slide_type_classification}'. "
-                f"Valid types: {ServiceRegistry.get_supported_types()}"
-            )
-
-        # Build full URL
-        url = f"{self.base_url}{endpoint}"
+        # Get full endpoint URL for slide type
+        url = self._endpoint_url(slide_type_classification)
 
         # Add slide_type to context (required by Text Service)
         if "context" not in request_payload:
             request_payload["context"] = {}
         request_payload["context"]["slide_type"] = slide_type_classification
 
-        logger.info(f"Calling {slide_type_classification} endpoint: {url}")
+        logger.info("Calling %s endpoint: %s", slide_type_classification, url)
 
-        # Attempt request with retries
-        last_error = None
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                response = await self.client.post(url, json=request_payload)
-                response.raise_for_status()
+        self._ensure_available()
 
-                result = response.json()
-                logger.info(f"✅ Generated content for {slide_type_classification} (attempt {attempt})")
-                return result
+        # Encode once; every attempt sends the same body
+        body = _json_dumps(request_payload)
 
-            except httpx.HTTPStatusError as e:
-                last_error = e
-                logger.error(
-                    f"HTTP {e.response.status_code} error for {slide_type_classification} "
-                    f"(attempt {attempt}/{self.max_retries}): {e.response.text}"
-                )
-                if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-
-            except httpx.RequestError as e:
-                last_error = e
-                logger.error(
-                    f"Request error for {slide_type_classification} "
-                    f"(attempt {attempt}/{self.max_retries}): {str(e)}"
-                )
-                if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)
-
-            except Exception as e:
-                last_error = e
-                logger.error(
-                    f"Unexpected error for {slide_type_classification} "
-                    f"(attempt {attempt}/{self.max_retries}): {str(e)}"
-                )
-                if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)
+        # Attempt request with retries
+        last_error = None
+        try:
+            # Bounds the whole call, backoff sleeps included; cancellation
+            # (or the budget running out) interrupts any pending retry
+            async with asyncio.timeout(self.overall_budget_seconds):
+                for attempt in range(1, self.max_retries + 1):
+                    try:
+                        response = await self.client.post(url, content=body, headers=_JSON_HEADERS)
+                        response.raise_for_status()
+
+                        result = _json_loads(response.content)
+                        self._record_success()
+                        logger.info("✅ Generated content for %s (attempt %d)", slide_type_classification, attempt)
+                        return result
+
+                    except httpx.HTTPStatusError as e:
+                        last_error = e
+                        logger.error(
+                            "HTTP %d error for %s (attempt %d/%d): %s",
+                            e.response.status_code, slide_type_classification,
+                            attempt, self.max_retries, _error_body(e.response)
+                        )
+                        if not _is_retryable_status(e.response.status_code):
+                            raise Exception(
+                                f"Failed to generate content for {slide_type_classification}: {e}"
+                            ) from e
+                        if attempt < self.max_retries:
+                            await asyncio.sleep(_backoff_delay(attempt, e.response))
+
+                    except httpx.RequestError as e:
+                        last_error = e
+                        logger.error(
+                            "Request error for %s (attempt %d/%d): %s",
+                            slide_type_classification, attempt, self.max_retries, e
+                        )
+                        if attempt < self.max_retries:
+                            await asyncio.sleep(_backoff_delay(attempt))
+
+                    except Exception as e:
+                        last_error = e
+                        logger.error(
+                            "Unexpected error for %s (attempt %d/%d): %s",
+                            slide_type_classification, attempt, self.max_retries, e
+                        )
+                        if attempt < self.max_retries:
+                            await asyncio.sleep(_backoff_delay(attempt))
+        except TimeoutError:
+            last_error = f"retry budget of {self.overall_budget_seconds}s exhausted ({last_error})"
 
         # All retries failed
         error_msg = f"Failed to generate content for {slide_type_classification} after {self.max_retries} attempts"
-        logger.error(f"{error_msg}: {last_error}")
+        logger.error("%s: %s", error_msg, last_error)
+        self._record_failure(last_error)
         raise Exception(f"{error_msg}: {last_error}")
 
     async def generate_batch(
@@ -143,6 +367,7 @@ class TextServiceInterface:
             - metadata: Dict - batch processing statistics
 
         Raises:
+            TextServiceUnavailableError: If the health cache marks the service unhealthy
             Exception: If batch API call fails after retries
         """
         # Ensure each request has slide_type in context
@@ -156,55 +381,172 @@ class TextServiceInterface:
                 raise ValueError(f"Request {i} missing slide_type in context")
 
         # Build batch endpoint URL
-        url = f"{self.base_url}{ServiceRegistry.get_batch_endpoint()}"
+        url = self._get_batch_url()
+
+        logger.info("Calling batch endpoint with %d slides: %s", len(requests), url)
 
-        logger.info(f"Calling batch endpoint with {len(requests)} slides: {url}")
+        self._ensure_available()
+
+        # Encode once; every attempt sends the same body
+        body = _json_dumps({"requests": requests})
 
         # Attempt request with retries
         last_error = None
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                response = await self.client.post(url, json={"requests": requests})
+        try:
+            # Bounds the whole call, backoff sleeps included; cancellation
+            # (or the budget running out) interrupts any pending retry
+            async with asyncio.timeout(self.overall_budget_seconds):
+                for attempt in range(1, self.max_retries + 1):
+                    try:
+                        response = await self.client.post(url, content=body, headers=_JSON_HEADERS)
+                        response.raise_for_status()
+
+                        result = _json_loads(response.content)
+                        self._record_success()
+                        logger.info(
+                            "✅ Batch generation complete: %s successful (attempt %d)",
+                            result.get('metadata', {}).get('successful', 0), attempt
+                        )
+                        return result
+
+                    except httpx.HTTPStatusError as e:
+                        last_error = e
+                        logger.error(
+                            "HTTP %d error for batch (attempt %d/%d): %s",
+                            e.response.status_code, attempt, self.max_retries,
+                            _error_body(e.response)
+                        )
+                        if not _is_retryable_status(e.response.status_code):
+                            raise Exception(f"Failed batch generation: {e}") from e
+                        if attempt < self.max_retries:
+                            await asyncio.sleep(_backoff_delay(attempt, e.response))
+
+                    except httpx.RequestError as e:
+                        last_error = e
+                        logger.error(
+                            "Request error for batch (attempt %d/%d): %s",
+                            attempt, self.max_retries, e
+                        )
+                        if attempt < self.max_retries:
+                            await asyncio.sleep(_backoff_delay(attempt))
+
+                    except Exception as e:
+                        last_error = e
+                        logger.error(
+                            "Unexpected error for batch (attempt %d/%d): %s",
+                            attempt, self.max_retries, e
+                        )
+                        if attempt < self.max_retries:
+                            await asyncio.sleep(_backoff_delay(attempt))
+        except TimeoutError:
+            last_error = f"retry budget of {self.overall_budget_seconds}s exhausted ({last_error})"
+
+        # All retries failed
+        error_msg = f"Failed batch generation after {self.max_retries} attempts"
+        logger.error("%s: %s", error_msg, last_error)
+        self._record_failure(last_error)
+        raise Exception(f"{error_msg}: {last_error}")
+
+    async def stream_batch(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Call the batch endpoint and yield each slide result as it arrives.
+
+        Asks for a streamed (SSE or NDJSON) response so the first slides can
+        be rendered before the slowest one finishes. If the service answers
+        with a plain JSON batch result instead, its "results" are yielded
+        once the whole body is in. Streams are not retried, since part of the
+        output may already have been consumed.
+
+        Args:
+            requests: List of TextGenerationRequest payloads
+
+        Yields:
+            GeneratedText dicts (or per-slide error dicts, as sent by the service)
+
+        Raises:
+            ValueError: If a request is missing slide_type in context
+            TextServiceUnavailableError: If the health cache marks the service unhealthy
+            httpx.HTTPError: If the request fails
+        """
+        for i, req in enumerate(requests):
+            if not req.get("context", {}).get("slide_type"):
+                raise ValueError(f"Request {i} missing slide_type in context")
+
+        url = self._get_batch_url()
+
+        logger.info("Streaming batch endpoint with %d slides: %s", len(requests), url)
+
+        self._ensure_available()
+
+        # Holds a concurrency slot for the lifetime of the stream
+        async with self._semaphore:
+            async with self.client.stream(
+                "POST",
+                url,
+                content=_json_dumps({"requests": requests}),
+                headers={
+                    **_JSON_HEADERS,
+                    "Accept": "text/event-stream, application/x-ndjson, application/json"
+                }
+            ) as response:
                 response.raise_for_status()
 
-                result = response.json()
-                logger.info(
-                    f"✅ Batch generation complete: {result.get('metadata', {}).get('successful', 0)} successful "
-                    f"(attempt {attempt})"
-                )
-                return result
+                if response.headers.get("content-type", "").startswith("application/json"):
+                    # Service does not stream; hand out the buffered results
+                    result = _json_loads(await response.aread())
+                    for item in result.get("results", []):
+                        yield item
+                    return
 
-            except httpx.HTTPStatusError as e:
-                last_error = e
-                logger.error(
-                    f"HTTP {e.response.status_code} error for batch "
-                    f"(attempt {attempt}/{self.max_retries}): {e.response.text}"
-                )
-                if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)
-
-            except httpx.RequestError as e:
-                last_error = e
-                logger.error(
-                    f"Request error for batch "
-                    f"(attempt {attempt}/{self.max_retries}): {str(e)}"
-                )
-                if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)
-
-            except Exception as e:
-                last_error = e
-                logger.error(
-                    f"Unexpected error for batch "
-                    f"(attempt {attempt}/{self.max_retries}): {str(e)}"
+                async for line in response.aiter_lines():
+                    item = _parse_stream_line(line)
+                    if item is not None:
+                        yield item
+
+    async def generate_many(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Generate slides concurrently through the individual specialized endpoints.
+
+        Fallback for when the batch endpoint is unavailable; at most
+        max_concurrency requests are in flight at once.
+
+        Args:
+            requests: List of TextGenerationRequest payloads (context.slide_type required)
+
+        Returns:
+            List aligned with requests: GeneratedText response dict on success,
+            or the raised exception on failure
+
+        Raises:
+            ValueError: If a request is missing context.slide_type
+        """
+        # Validate up front, as generate_batch does
+        for i, req in enumerate(requests):
+            if not req.get("context", {}).get("slide_type"):
+                raise ValueError(f"Request {i} missing slide_type in context")
+
+        async def generate_one(request: Dict[str, Any]) -> Dict[str, Any]:
+            async with self._semaphore:
+                return await self.generate_specialized(
+                    request["context"]["slide_type"],
+                    request
                 )
-                if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)
 
-        # All retries failed
-        error_msg = f"Failed batch generation after {self.max_retries} attempts"
-        logger.error(f"{error_msg}: {last_error}")
-        raise Exception(f"{error_msg}: {last_error}")
+        logger.info(
+            "Generating %d slides individually (max %d concurrent)",
+            len(requests), self.max_concurrency
+        )
+
+        return await asyncio.gather(
+            *(generate_one(request) for request in requests),
+            return_exceptions=True
+        )
 
     async def health_check(self) -> bool:
         """
@@ -220,7 +562,7 @@ class TextServiceInterface:
             logger.info("✅ Text Service health check passed")
             return True
         except Exception as e:
-            logger.error(f"❌ Text Service health check failed: {e}")
+            logger.error("❌ Text Service health check failed: %s", e)
             return False
 
     def build_request_payload(
@@ -253,6 +595,11 @@ class TextServiceInterface:
         }
 
 
+class TextServiceUnavailableError(Exception):
+    """Raised without contacting the Text Service while it is known to be unhealthy."""
+    pass
+
+
 # Convenience function
 
 async def create_text_service_client(base_url: str) -> TextServiceInterface:
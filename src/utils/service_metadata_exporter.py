@@ -14,10 +14,94 @@ Version: 1.0.0
 Created: 2025-11-29
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from bisect import insort
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+import hashlib
 import json
-from pydantic import BaseModel, Field
+import sys
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Buffer size for export file writes
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# (service_name, digest of service data) -> exporter, for cached reloads
+_EXPORTER_CACHE: "OrderedDict[Tuple[str, bytes], ServiceMetadataExporter]" = OrderedDict()
+_EXPORTER_CACHE_SIZE = 32
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a heavily repeated string field (other values pass through)."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy the dicts and lists of a JSON-shaped value (leaves are shared)."""
+    if type(value) is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _encode_json(data: Dict[str, Any], indent: Optional[int]) -> bytes:
+    """
+    Serialize to UTF-8 JSON (orjson for the default 2-space indent).
+
+    Non-ASCII characters are written as raw UTF-8 rather than \\u escapes,
+    as orjson does, so the output is the same whichever path is taken.
+    """
+    if orjson is not None and indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode()
+
+
+def _encode_json_line(data: Dict[str, Any]) -> bytes:
+    """Serialize to one compact line of UTF-8 JSON, newline included."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+
+
+# JSON Schema examples for the models below (only read by model_json_schema)
+_VARIANT_EXAMPLE = {
+    "variant_id": "pie_chart",
+    "display_name": "Pie Chart",
+    "description": "Circular chart showing proportional data",
+    "status": "production",
+    "endpoint": "/v3/charts/pie",
+    "layout_id": "L01",
+    "keywords": ["pie", "donut", "chart", "percentage", "proportion"],
+    "priority": 2,
+    "use_cases": ["Market share analysis", "Budget breakdown"],
+    "best_for": "Showing parts of a whole (3-7 segments)",
+    "avoid_when": "More than 7 categories or comparing trends",
+    "required_fields": ["data", "title"],
+    "optional_fields": ["colors", "show_legend"],
+    "output_format": "html"
+}
+
+_SERVICE_EXAMPLE = {
+    "service_name": "analytics_service_v3",
+    "service_version": "3.0.0",
+    "service_type": "data_visualization",
+    "base_url": "https://analytics-v30-production.up.railway.app",
+    "supports_batch": True,
+    "supports_streaming": False,
+    "authentication_required": False,
+    "variants": [],  # Would contain VariantMetadata objects
+    "last_updated": "2025-11-29T12:00:00+00:00",
+    "maintainer": "analytics-team@example.com",
+    "documentation_url": "https://docs.example.com/analytics-v3"
+}
 
 
 class VariantMetadata(BaseModel):
@@ -47,25 +131,11 @@ class VariantMetadata(BaseModel):
     optional_fields: List[str] = Field(default_factory=list, description="Optional input fields")
     output_format: str = Field("html", description="Output format (html, json, svg, etc.)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "variant_id": "pie_chart",
-                "display_name": "Pie Chart",
-                "description": "Circular chart showing proportional data",
-                "status": "production",
-                "endpoint": "/v3/charts/pie",
-                "layout_id": "L01",
-                "keywords": ["pie", "donut", "chart", "percentage", "proportion"],
-                "priority": 2,
-                "use_cases": ["Market share analysis", "Budget breakdown"],
-                "best_for": "Showing parts of a whole (3-7 segments)",
-                "avoid_when": "More than 7 categories or comparing trends",
-                "required_fields": ["data", "title"],
-                "optional_fields": ["colors", "show_legend"],
-                "output_format": "html"
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra={"example": _VARIANT_EXAMPLE}
+    )
 
 
 class ServiceMetadata(BaseModel):
@@ -88,26 +158,36 @@ class ServiceMetadata(BaseModel):
     variants: List[VariantMetadata] = Field(..., description="All variants this service provides")
 
     # Metadata
-    last_updated: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    last_updated: str = Field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec='seconds')
+    )
     maintainer: Optional[str] = Field(None, description="Service maintainer contact")
     documentation_url: Optional[str] = Field(None, description="Link to service documentation")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "service_name": "analytics_service_v3",
-                "service_version": "3.0.0",
-                "service_type": "data_visualization",
-                "base_url": "https://analytics-v30-production.up.railway.app",
-                "supports_batch": True,
-                "supports_streaming": False,
-                "authentication_required": False,
-                "variants": [],  # Would contain VariantMetadata objects
-                "last_updated": "2025-11-29T12:00:00",
-                "maintainer": "analytics-team@example.com",
-                "documentation_url": "https://docs.example.com/analytics-v3"
-            }
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra={"example": _SERVICE_EXAMPLE}
+    )
+
+
+@dataclass(slots=True, kw_only=True)
+class _VariantRecord:
+    """Internal, unvalidated variant storage (fields as in VariantMetadata)."""
+    variant_id: str
+    display_name: str
+    description: str
+    status: str
+    endpoint: str
+    layout_id: Optional[str]
+    keywords: List[str]
+    priority: int
+    use_cases: List[str] = field(default_factory=list)
+    best_for: Optional[str] = None
+    avoid_when: Optional[str] = None
+    required_fields: List[str] = field(default_factory=list)
+    optional_fields: List[str] = field(default_factory=list)
+    output_format: str = "html"
 
 
 class ServiceMetadataExporter:
@@ -165,10 +245,11 @@ class ServiceMetadataExporter:
             maintainer: Service maintainer contact
             documentation_url: Link to service documentation
         """
-        self.metadata = ServiceMetadata(
+        # Service-level fields; variants are kept separately as plain dicts
+        self._metadata = ServiceMetadata(
             service_name=service_name,
             service_version=service_version,
-            service_type=service_type,
+            service_type=_intern(service_type),
             base_url=base_url,
             supports_batch=supports_batch,
             supports_streaming=supports_streaming,
@@ -177,6 +258,34 @@ class ServiceMetadataExporter:
             documentation_url=documentation_url,
             variants=[]
         )
+        # Variants as slotted records, validated in add_variant
+        self._variants: List[_VariantRecord] = []
+        # variant_id -> ready-to-emit registry entry, built in add_variant
+        self._variant_entries: Dict[str, Dict[str, Any]] = {}
+        # Running stats, updated by add_variant
+        self._status_counts: Counter = Counter()
+        self._priority_counts: Counter = Counter()
+        self._layout_ids: set = set()
+        self._sorted_layout_ids: List[str] = []
+        self._keyword_total = 0
+        # Endpoint-pattern inputs: unique endpoints, and whether all of
+        # them are typed (/charts/ or /diagrams/) ones
+        self._endpoints: set = set()
+        self._all_endpoints_typed = True
+        # Registry dict of the last export; cleared by add_variant
+        self._export_cache: Optional[Dict[str, Any]] = None
+
+    @property
+    def metadata(self) -> ServiceMetadata:
+        """
+        Snapshot of the service metadata, including all variants.
+
+        Built on access; changes to the returned model are not reflected
+        in the exporter.
+        """
+        return self._metadata.model_copy(update={
+            "variants": [VariantMetadata.model_construct(**asdict(v)) for v in self._variants]
+        })
 
     def add_variant(
         self,
@@ -216,8 +325,55 @@ class ServiceMetadataExporter:
 
         Returns:
             Self for method chaining
+
+        Raises:
+            ValueError: If any argument violates the VariantMetadata constraints
         """
-        variant = VariantMetadata(
+        # Same constraints as VariantMetadata, checked inline instead of
+        # building a model per variant
+        for name, value in (
+            ("variant_id", variant_id),
+            ("display_name", display_name),
+            ("description", description),
+            ("endpoint", endpoint),
+            ("status", status),
+            ("output_format", output_format),
+        ):
+            if not isinstance(value, str):
+                raise ValueError(
+                    f"Variant '{variant_id}' {name} must be a string, got {type(value).__name__}"
+                )
+        for name, value in (
+            ("layout_id", layout_id),
+            ("best_for", best_for),
+            ("avoid_when", avoid_when),
+        ):
+            if value is not None and not isinstance(value, str):
+                raise ValueError(
+                    f"Variant '{variant_id}' {name} must be a string or None, got {type(value).__name__}"
+                )
+        for name, value in (
+            ("keywords", keywords),
+            ("use_cases", use_cases),
+            ("required_fields", required_fields),
+            ("optional_fields", optional_fields),
+        ):
+            if value is not None and not (
+                isinstance(value, list) and all(isinstance(item, str) for item in value)
+            ):
+                raise ValueError(
+                    f"Variant '{variant_id}' {name} must be a list of strings"
+                )
+        if len(keywords) < 5:
+            raise ValueError(
+                f"Variant '{variant_id}' needs at least 5 keywords, got {len(keywords)}"
+            )
+        if not isinstance(priority, int) or not 1 <= priority <= 10:
+            raise ValueError(
+                f"Variant '{variant_id}' priority must be an integer from 1 to 10, got {priority!r}"
+            )
+
+        return self.add_variant_trusted(
             variant_id=variant_id,
             display_name=display_name,
             description=description,
@@ -226,21 +382,107 @@ class ServiceMetadataExporter:
             priority=priority,
             layout_id=layout_id,
             status=status,
-            use_cases=use_cases or [],
+            use_cases=use_cases,
+            best_for=best_for,
+            avoid_when=avoid_when,
+            required_fields=required_fields,
+            optional_fields=optional_fields,
+            output_format=output_format
+        )
+
+    def add_variant_trusted(
+        self,
+        variant_id: str,
+        display_name: str,
+        description: str,
+        endpoint: str,
+        keywords: List[str],
+        priority: int = 5,
+        layout_id: Optional[str] = None,
+        status: str = "production",
+        use_cases: Optional[List[str]] = None,
+        best_for: Optional[str] = None,
+        avoid_when: Optional[str] = None,
+        required_fields: Optional[List[str]] = None,
+        optional_fields: Optional[List[str]] = None,
+        output_format: str = "html"
+    ) -> "ServiceMetadataExporter":
+        """
+        Add a variant without validating it.
+
+        For data that was already validated, e.g. variants reloaded from a
+        registry this module exported. Takes the same arguments as
+        add_variant().
+
+        Returns:
+            Self for method chaining
+        """
+        # Status, layout and output format repeat across most variants
+        status = _intern(status)
+        layout_id = _intern(layout_id)
+        output_format = _intern(output_format)
+
+        variant = _VariantRecord(
+            variant_id=variant_id,
+            display_name=display_name,
+            description=description,
+            status=status,
+            endpoint=endpoint,
+            layout_id=layout_id,
+            keywords=list(keywords),
+            priority=priority,
+            use_cases=list(use_cases) if use_cases else [],
             best_for=best_for,
             avoid_when=avoid_when,
-            required_fields=required_fields or [],
-            optional_fields=optional_fields or [],
+            required_fields=list(required_fields) if required_fields else [],
+            optional_fields=list(optional_fields) if optional_fields else [],
             output_format=output_format
         )
+        self._variants.append(variant)
+
+        # Registry entry, built once here rather than on every export
+        self._variant_entries[variant_id] = {
+            "variant_id": variant.variant_id,
+            "display_name": variant.display_name,
+            "description": variant.description,
+            "status": variant.status,
+            "endpoint": variant.endpoint,
+            "layout_id": variant.layout_id,
+            "classification": {
+                "priority": variant.priority,
+                "keywords": variant.keywords
+            },
+            "llm_guidance": {
+                "use_cases": variant.use_cases,
+                "best_for": variant.best_for,
+                "avoid_when": variant.avoid_when
+            },
+            "parameters": {
+                "required_fields": variant.required_fields,
+                "optional_fields": variant.optional_fields,
+                "output_format": variant.output_format
+            }
+        }
 
-        self.metadata.variants.append(variant)
+        self._status_counts[status] += 1
+        self._priority_counts[priority] += 1
+        self._keyword_total += len(keywords)
+        self._endpoints.add(endpoint)
+        if "/charts/" not in endpoint and "/diagrams/" not in endpoint:
+            self._all_endpoints_typed = False
+        if layout_id and layout_id not in self._layout_ids:
+            self._layout_ids.add(layout_id)
+            insort(self._sorted_layout_ids, layout_id)
+        self._export_cache = None
         return self
 
     def export_to_registry_format(self) -> Dict[str, Any]:
         """
         Export metadata in unified registry format.
 
+        Returns a fresh copy on every call, so callers may merge and edit
+        it without affecting the exporter.
+
         Returns:
             Dict suitable for inclusion in unified_variant_registry.json
 
@@ -257,68 +499,56 @@ class ServiceMetadataExporter:
                 }
             }
         """
-        # Determine endpoint pattern
-        if len(self.metadata.variants) == 1:
+        return _copy_json(self._registry_format())
+
+    def _registry_format(self) -> Dict[str, Any]:
+        """
+        Build the registry-format dict, shared with the exporter's state.
+
+        Variant entries and the endpoint-pattern inputs are maintained by
+        add_variant, so this only wraps them. The result is cached until the
+        next add_variant; it is only read by the export methods below and
+        must not be handed out.
+        """
+        if self._export_cache is not None:
+            return self._export_cache
+
+        metadata = self._metadata
+
+        # Determine endpoint pattern (inputs tracked by add_variant)
+        if len(self._variants) == 1 or len(self._endpoints) == 1:
             endpoint_pattern = "single"
+        elif self._all_endpoints_typed:
+            endpoint_pattern = "typed"
         else:
-            # Check if endpoints are per-variant or typed
-            endpoints = [v.endpoint for v in self.metadata.variants]
-            if len(set(endpoints)) == 1:
-                endpoint_pattern = "single"
-            elif all("/charts/" in ep or "/diagrams/" in ep for ep in endpoints):
-                endpoint_pattern = "typed"
-            else:
-                endpoint_pattern = "per_variant"
-
-        # Build variants dict
-        variants_dict = {}
-        for variant in self.metadata.variants:
-            variants_dict[variant.variant_id] = {
-                "variant_id": variant.variant_id,
-                "display_name": variant.display_name,
-                "description": variant.description,
-                "status": variant.status,
-                "endpoint": variant.endpoint,
-                "layout_id": variant.layout_id,
-                "classification": {
-                    "priority": variant.priority,
-                    "keywords": variant.keywords
-                },
-                "llm_guidance": {
-                    "use_cases": variant.use_cases,
-                    "best_for": variant.best_for,
-                    "avoid_when": variant.avoid_when
-                },
-                "parameters": {
-                    "required_fields": variant.required_fields,
-                    "optional_fields": variant.optional_fields,
-                    "output_format": variant.output_format
-                }
-            }
-
-        return {
-            self.metadata.service_name: {
-                "service_name": self.metadata.service_name,
-                "service_version": self.metadata.service_version,
-                "service_type": self.metadata.service_type,
-                "base_url": self.metadata.base_url,
+            endpoint_pattern = "per_variant"
+
+        registry_format = {
+            metadata.service_name: {
+                "service_name": metadata.service_name,
+                "service_version": metadata.service_version,
+                "service_type": metadata.service_type,
+                "base_url": metadata.base_url,
                 "endpoint_pattern": endpoint_pattern,
                 "authentication": {
-                    "required": self.metadata.authentication_required
+                    "required": metadata.authentication_required
                 },
                 "capabilities": {
-                    "batch_processing": self.metadata.supports_batch,
-                    "streaming": self.metadata.supports_streaming
+                    "batch_processing": metadata.supports_batch,
+                    "streaming": metadata.supports_streaming
                 },
                 "metadata": {
-                    "last_updated": self.metadata.last_updated,
-                    "maintainer": self.metadata.maintainer,
-                    "documentation_url": self.metadata.documentation_url
+                    "last_updated": metadata.last_updated,
+                    "maintainer": metadata.maintainer,
+                    "documentation_url": metadata.documentation_url
                 },
-                "variants": variants_dict
+                "variants": dict(self._variant_entries)
             }
         }
 
+        self._export_cache = registry_format
+        return registry_format
+
     def export_to_json(self, indent: int = 2) -> str:
         """
         Export metadata as JSON string.
@@ -329,8 +559,8 @@ class ServiceMetadataExporter:
         Returns:
             JSON string in registry format
         """
-        registry_format = self.export_to_registry_format()
-        return json.dumps(registry_format, indent=indent)
+        registry_format = self._registry_format()
+        return _encode_json(registry_format, indent).decode()
 
     def export_to_file(self, filepath: str, indent: int = 2) -> None:
         """
@@ -340,17 +570,43 @@ class ServiceMetadataExporter:
             filepath: Path to output file
             indent: JSON indentation (default: 2)
         """
-        registry_format = self.export_to_registry_format()
-        with open(filepath, 'w') as f:
-            json.dump(registry_format, f, indent=indent)
+        registry_format = self._registry_format()
+        with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(_encode_json(registry_format, indent))
+
+    def export_to_file_batched(self, filepath: str, batch_size: int = 5000) -> None:
+        """
+        Export metadata to a JSON Lines file.
+
+        The first line is the service entry without its variants, followed
+        by one line per variant entry, so readers can ingest variants one
+        at a time. Lines are written batch_size at a time.
+
+        Args:
+            filepath: Path to output file
+            batch_size: Number of variant lines per write
+        """
+        service_entry = self._registry_format()[self._metadata.service_name]
+        header = {key: value for key, value in service_entry.items() if key != "variants"}
+
+        with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(_encode_json_line(header))
+
+            batch = []
+            for variant in service_entry["variants"].values():
+                batch.append(_encode_json_line(variant))
+                if len(batch) >= batch_size:
+                    f.writelines(batch)
+                    batch.clear()
+            f.writelines(batch)
 
     def get_variant_count(self) -> int:
         """Get number of variants."""
-        return len(self.metadata.variants)
+        return len(self._variants)
 
     def get_keyword_count(self) -> int:
         """Get total number of keywords across all variants."""
-        return sum(len(v.keywords) for v in self.metadata.variants)
+        return self._keyword_total
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -359,14 +615,17 @@ class ServiceMetadataExporter:
         Returns:
             Dict with statistics
         """
+        variant_count = self.get_variant_count()
+        keyword_count = self.get_keyword_count()
+
         return {
-            "service_name": self.metadata.service_name,
-            "service_version": self.metadata.service_version,
-            "variant_count": self.get_variant_count(),
-            "total_keywords": self.get_keyword_count(),
+            "service_name": self._metadata.service_name,
+            "service_version": self._metadata.service_version,
+            "variant_count": variant_count,
+            "total_keywords": keyword_count,
             "avg_keywords_per_variant": (
-                self.get_keyword_count() / self.get_variant_count()
-                if self.get_variant_count() > 0 else 0
+                keyword_count / variant_count
+                if variant_count > 0 else 0
             ),
             "status_breakdown": self._get_status_breakdown(),
             "priority_distribution": self._get_priority_distribution(),
@@ -375,27 +634,21 @@ class ServiceMetadataExporter:
 
     def _get_status_breakdown(self) -> Dict[str, int]:
         """Get breakdown of variants by status."""
-        breakdown = {}
-        for variant in self.metadata.variants:
-            breakdown[variant.status] = breakdown.get(variant.status, 0) + 1
-        return breakdown
+        return dict(self._status_counts)
 
     def _get_priority_distribution(self) -> Dict[int, int]:
         """Get distribution of variants by priority."""
-        distribution = {}
-        for variant in self.metadata.variants:
-            distribution[variant.priority] = distribution.get(variant.priority, 0) + 1
-        return distribution
+        return dict(self._priority_counts)
 
     def _get_layout_ids(self) -> List[str]:
         """Get list of unique layout IDs."""
-        layout_ids = [v.layout_id for v in self.metadata.variants if v.layout_id]
-        return sorted(set(layout_ids))
+        return list(self._sorted_layout_ids)
 
 
 def create_exporter_from_registry(
     registry_data: Dict[str, Any],
-    service_name: str
+    service_name: str,
+    cached: bool = False
 ) -> ServiceMetadataExporter:
     """
     Create exporter from existing registry data.
@@ -406,12 +659,41 @@ def create_exporter_from_registry(
     Args:
         registry_data: Registry data (from unified_variant_registry.json)
         service_name: Service name to extract
+        cached: Reuse the exporter built for identical service data
+            (LRU of 32). Cached exporters are shared between callers and
+            must not be modified.
 
     Returns:
         ServiceMetadataExporter with data from registry
     """
     service_data = registry_data["services"][service_name]
 
+    if not cached:
+        return _exporter_from_service_data(service_name, service_data)
+
+    if orjson is not None:
+        canonical = orjson.dumps(service_data, option=orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps(service_data, sort_keys=True).encode()
+    key = (service_name, hashlib.blake2b(canonical, digest_size=16).digest())
+
+    exporter = _EXPORTER_CACHE.get(key)
+    if exporter is not None:
+        _EXPORTER_CACHE.move_to_end(key)
+        return exporter
+
+    exporter = _exporter_from_service_data(service_name, service_data)
+    _EXPORTER_CACHE[key] = exporter
+    if len(_EXPORTER_CACHE) > _EXPORTER_CACHE_SIZE:
+        _EXPORTER_CACHE.popitem(last=False)
+    return exporter
+
+
+def _exporter_from_service_data(
+    service_name: str,
+    service_data: Dict[str, Any]
+) -> ServiceMetadataExporter:
+    """Build an exporter from one service's registry entry."""
     exporter = ServiceMetadataExporter(
         service_name=service_name,
         service_version=service_data.get("service_version", "1.0.0"),
@@ -424,9 +706,9 @@ def create_exporter_from_registry(
         documentation_url=service_data.get("metadata", {}).get("documentation_url")
     )
 
-    # Add variants
+    # Add variants; registry entries were validated when first exported
     for variant_id, variant_data in service_data["variants"].items():
-        exporter.add_variant(
+        exporter.add_variant_trusted(
             variant_id=variant_id,
             display_name=variant_data["display_name"],
             description=variant_data["description"],
@@ -444,3 +726,21 @@ def create_exporter_from_registry(
         )
 
     return exporter
+
+
+def create_exporter_from_bytes(raw: bytes, service_name: str) -> ServiceMetadataExporter:
+    """
+    Create exporter from raw registry JSON.
+
+    Decodes with orjson when available, avoiding a separate stdlib parse
+    by the caller.
+
+    Args:
+        raw: Contents of unified_variant_registry.json
+        service_name: Service name to extract
+
+    Returns:
+        ServiceMetadataExporter with data from registry
+    """
+    registry_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return create_exporter_from_registry(registry_data, service_name)
@@ -5,7 +5,7 @@ Service Registry for Director v3.4
 Central registry managing routing between multiple content generation services:
 - Text Service v1.2 (10 content types, 34 platinum variants + 3 hero types)
 - Illustrator Service v1.0 (pyramid, future visualizations)
-- Hero Service (currently using Text Service endpoints)
+- Hero Service (alias of the Text Service hero endpoints)
 
 This registry enables:
 1. Dynamic service routing based on slide type
@@ -22,8 +22,13 @@ Author: Director v3.4 Integration Team
 Updated: January 15, 2025 (Illustrator Service integration)
 """
 
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple, Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+import logging
+import sys
+import threading
 from enum import Enum
 from src.utils.logger import setup_logger
 from config.settings import get_settings
@@ -39,7 +44,7 @@ class ServiceType(str, Enum):
     HERO_SERVICE = "hero_service"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceEndpoint:
     """
     Configuration for a service endpoint.
@@ -56,7 +61,7 @@ class ServiceEndpoint:
     requires_session: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceConfig:
     """
     Configuration for a content generation service.
@@ -64,18 +69,42 @@ class ServiceConfig:
     Attributes:
         enabled: Whether service is enabled
         base_url: Service base URL
-        slide_types: List of slide types this service handles
-        endpoints: Dict mapping endpoint names to ServiceEndpoint configs
+        slide_types: Slide types this service handles, in declaration order
+        endpoints: Read-only mapping of endpoint names to ServiceEndpoint configs
         version: Service version
         health_endpoint: Health check endpoint path
     """
     enabled: bool
     base_url: str
-    slide_types: List[str]
-    endpoints: Dict[str, ServiceEndpoint] = field(default_factory=dict)
+    slide_types: Tuple[str, ...]
+    endpoints: Mapping[str, ServiceEndpoint] = field(default_factory=dict)
     version: Optional[str] = None
     health_endpoint: str = "/health"
 
+    def __post_init__(self) -> None:
+        # Frozen, so normalize through object.__setattr__
+        object.__setattr__(self, "slide_types", tuple(self.slide_types))
+        object.__setattr__(self, "endpoints", MappingProxyType(dict(self.endpoints)))
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceAlias:
+    """
+    A service name that forwards to endpoints of another service.
+
+    Attributes:
+        target: Name of the service that actually serves the requests
+        endpoint_map: Mapping of alias endpoint names to target endpoint names
+        slide_types: Slide types advertised under the alias name
+    """
+    target: str
+    endpoint_map: Mapping[str, str]
+    slide_types: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "endpoint_map", MappingProxyType(dict(self.endpoint_map)))
+        object.__setattr__(self, "slide_types", tuple(self.slide_types))
+
 
 class ServiceRegistry:
     """
@@ -87,31 +116,52 @@ class ServiceRegistry:
     14 Slide Types → 3 Services:
     - Text Service v1.2: 10 content types (34 variants) + 3 hero types
     - Illustrator Service v1.0: 1 visualization type (pyramid)
-    - Hero Service: 3 hero types (currently uses Text Service)
+    - Hero Service: 3 hero types (alias of Text Service endpoints)
+
+    Service configs and routing tables are built on first query, not at
+    construction; use get_service_registry() to share one instance per process.
 
     Usage:
-        registry = ServiceRegistry()
+        registry = get_service_registry()
         service = registry.get_service_for_slide_type("pyramid")
         endpoint = registry.get_endpoint("illustrator_service", "pyramid")
     """
 
     def __init__(self):
         """Initialize service registry with configuration from settings."""
-        settings = get_settings()
+        self._settings = get_settings()
+        self._initialized = False
+        self._init_lock = threading.Lock()
         self._services: Dict[str, ServiceConfig] = {}
+        self._aliases: Dict[str, ServiceAlias] = {}  # alias name -> ServiceAlias
         self._slide_type_map: Dict[str, str] = {}  # slide_type -> service_name
-
-        self._initialize_services(settings)
-        self._build_slide_type_map()
-
-        logger.info(
-            "ServiceRegistry initialized",
-            extra={
-                "services": list(self._services.keys()),
-                "enabled_services": [k for k, v in self._services.items() if v.enabled],
-                "total_slide_types": len(self._slide_type_map)
-            }
-        )
+        self._service_for_slide_type_cache: Dict[str, ServiceConfig] = {}
+        self._route_cache: Dict[str, Mapping[str, Any]] = {}  # slide_type -> routing info
+        self._supported_slide_types: List[str] = []
+        self._full_urls: Dict[Tuple[str, str], str] = {}  # (service_name, endpoint_name) -> URL
+        self._canonical_slide_types: Dict[str, str] = {}  # slide_type -> interned slide_type
+
+    def _ensure_initialized(self) -> None:
+        """Build service configs and routing tables on first use."""
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._initialize_services(self._settings)
+            self._build_flat_table()
+            self._build_slide_type_map()
+            self._initialized = True
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "ServiceRegistry initialized",
+                extra={
+                    "services": [*self._services, *self._aliases],
+                    "enabled_services": self._enabled_service_names(),
+                    "total_slide_types": len(self._slide_type_map)
+                }
+            )
 
     def _initialize_services(self, settings) -> None:
         """
@@ -251,49 +301,109 @@ class ServiceRegistry:
             }
         )
 
-        # Hero Service Configuration
-        # Note: Currently using Text Service endpoints, structured for future separation
-        self._services["hero_service"] = ServiceConfig(
-            enabled=settings.TEXT_SERVICE_ENABLED,  # Using Text Service for now
-            base_url=settings.TEXT_SERVICE_URL,
-            version="1.2",
-            slide_types=["hero_title", "hero_section", "hero_closing"],
-            endpoints={
-                "title": ServiceEndpoint(
-                    path="/v1.2/hero/title",
-                    method="POST",
-                    timeout=60
-                ),
-                "section": ServiceEndpoint(
-                    path="/v1.2/hero/section",
-                    method="POST",
-                    timeout=60
-                ),
-                "closing": ServiceEndpoint(
-                    path="/v1.2/hero/closing",
-                    method="POST",
-                    timeout=60
-                )
-            }
+        # Hero Service
+        # Note: Currently served by the Text Service hero endpoints, so it is an
+        # alias rather than a second ServiceConfig; structured for future separation
+        self._aliases["hero_service"] = ServiceAlias(
+            target="text_service",
+            endpoint_map={
+                "title": "hero_title",
+                "section": "hero_section",
+                "closing": "hero_closing"
+            },
+            slide_types=["hero_title", "hero_section", "hero_closing"]
+        )
+
+        # Intern service names so interned lookups compare by identity
+        self._services = {sys.intern(name): config for name, config in self._services.items()}
+        self._aliases = {sys.intern(name): alias for name, alias in self._aliases.items()}
+
+    def _build_flat_table(self) -> None:
+        """Precompute the full URL of every (service, endpoint) pair."""
+        for service_name, config in self._services.items():
+            for endpoint_name, endpoint in config.endpoints.items():
+                self._full_urls[(service_name, endpoint_name)] = f"{config.base_url}{endpoint.path}"
+
+        for alias_name, alias in self._aliases.items():
+            for endpoint_name, target_endpoint in alias.endpoint_map.items():
+                full_url = self._full_urls.get((alias.target, target_endpoint))
+                if full_url:
+                    self._full_urls[(alias_name, endpoint_name)] = full_url
+
+    def _get_service(self, service_name: str) -> Optional[ServiceConfig]:
+        """Look up a service config, following aliases to their target."""
+        service = self._services.get(service_name)
+        if service is None:
+            alias = self._aliases.get(service_name)
+            if alias is not None:
+                service = self._services.get(alias.target)
+        return service
+
+    def _enabled_service_names(self) -> List[str]:
+        """Names of enabled services, followed by aliases of enabled services."""
+        names = [name for name, config in self._services.items() if config.enabled]
+        names.extend(
+            name for name, alias in self._aliases.items()
+            if self._services[alias.target].enabled
         )
+        return names
 
     def _build_slide_type_map(self) -> None:
         """Build reverse mapping from slide types to services."""
         for service_name, config in self._services.items():
             if config.enabled:
                 for slide_type in config.slide_types:
+                    slide_type = sys.intern(slide_type)
                     # Handle potential conflicts (same slide type in multiple services)
                     if slide_type in self._slide_type_map:
                         existing_service = self._slide_type_map[slide_type]
                         # Prefer specialized services over generic ones
                         if service_name == "illustrator_service":
                             logger.info(
-                                f"Overriding slide type '{slide_type}': {existing_service} → {service_name}"
+                                "Overriding slide type '%s': %s → %s",
+                                slide_type, existing_service, service_name
                             )
                             self._slide_type_map[slide_type] = service_name
                     else:
                         self._slide_type_map[slide_type] = service_name
 
+        # Routing is static after init, so resolve every slide type once here
+        # and let the lookups below be a single dict probe
+        for slide_type, service_name in self._slide_type_map.items():
+            service = self._services[service_name]
+            endpoint_name = self._get_default_endpoint(service_name, slide_type)
+            full_url = self._full_urls.get((service_name, endpoint_name))
+
+            self._canonical_slide_types[slide_type] = slide_type
+            self._service_for_slide_type_cache[slide_type] = service
+            self._route_cache[slide_type] = MappingProxyType({
+                "service_name": service_name,
+                "service_config": service,
+                "endpoint_name": endpoint_name,
+                "full_url": full_url,
+                "slide_type": slide_type
+            })
+
+        # Union across enabled services, in first-declared order
+        self._supported_slide_types = list(self._slide_type_map)
+
+    def normalize_slide_type(self, slide_type: str) -> str:
+        """
+        Return the registry's interned copy of a known slide type.
+
+        Callers that look up the same slide type repeatedly (e.g. one taken
+        from a request payload) can normalize it once so later lookups hit
+        the identity fast path in dict key comparison.
+
+        Args:
+            slide_type: Slide type identifier
+
+        Returns:
+            The interned slide type if known, otherwise slide_type unchanged
+        """
+        self._ensure_initialized()
+        return self._canonical_slide_types.get(slide_type, slide_type)
+
     def get_service_for_slide_type(self, slide_type: str) -> Optional[ServiceConfig]:
         """
         Get the service configuration responsible for a slide type.
@@ -304,18 +414,10 @@ class ServiceRegistry:
         Returns:
             ServiceConfig if found, None otherwise
         """
-        service_name = self._slide_type_map.get(slide_type)
-        if not service_name:
-            logger.warning(f"No service found for slide type: {slide_type}")
-            return None
-
-        service = self._services.get(service_name)
-        if not service or not service.enabled:
-            logger.warning(
-                f"Service '{service_name}' for slide type '{slide_type}' is not enabled"
-            )
-            return None
-
+        self._ensure_initialized()
+        service = self._service_for_slide_type_cache.get(slide_type)
+        if service is None:
+            logger.warning("No service found for slide type: %s", slide_type)
         return service
 
     def get_endpoint(
@@ -326,6 +428,9 @@ class ServiceRegistry:
         """
         Get endpoint configuration for a service.
 
+        Aliased services (e.g. "hero_service") resolve to the target
+        service's endpoint.
+
         Args:
             service_name: Service identifier (e.g., "illustrator_service")
             endpoint_name: Endpoint name (e.g., "pyramid", "generate")
@@ -333,19 +438,27 @@ class ServiceRegistry:
         Returns:
             ServiceEndpoint if found, None otherwise
         """
+        self._ensure_initialized()
         service = self._services.get(service_name)
+        target_endpoint = endpoint_name
+        if service is None:
+            alias = self._aliases.get(service_name)
+            if alias is not None:
+                service = self._services.get(alias.target)
+                target_endpoint = alias.endpoint_map.get(endpoint_name)
+
         if not service:
-            logger.error(f"Service not found: {service_name}")
+            logger.error("Service not found: %s", service_name)
             return None
 
         if not service.enabled:
-            logger.error(f"Service '{service_name}' is not enabled")
+            logger.error("Service '%s' is not enabled", service_name)
             return None
 
-        endpoint = service.endpoints.get(endpoint_name)
+        endpoint = service.endpoints.get(target_endpoint)
         if not endpoint:
             logger.error(
-                f"Endpoint '{endpoint_name}' not found in service '{service_name}'"
+                "Endpoint '%s' not found in service '%s'", endpoint_name, service_name
             )
             return None
 
@@ -362,15 +475,8 @@ class ServiceRegistry:
         Returns:
             Full URL (base_url + endpoint_path) or None if not found
         """
-        service = self._services.get(service_name)
-        if not service:
-            return None
-
-        endpoint = service.endpoints.get(endpoint_name)
-        if not endpoint:
-            return None
-
-        return f"{service.base_url}{endpoint.path}"
+        self._ensure_initialized()
+        return self._full_urls.get((service_name, endpoint_name))
 
     def is_service_enabled(self, service_name: str) -> bool:
         """
@@ -382,7 +488,8 @@ class ServiceRegistry:
         Returns:
             True if enabled, False otherwise
         """
-        service = self._services.get(service_name)
+        self._ensure_initialized()
+        service = self._get_service(service_name)
         return bool(service and service.enabled)
 
     def get_enabled_services(self) -> List[str]:
@@ -392,10 +499,8 @@ class ServiceRegistry:
         Returns:
             List of enabled service names
         """
-        return [
-            name for name, config in self._services.items()
-            if config.enabled
-        ]
+        self._ensure_initialized()
+        return self._enabled_service_names()
 
     def get_supported_slide_types(self, service_name: Optional[str] = None) -> List[str]:
         """
@@ -405,20 +510,18 @@ class ServiceRegistry:
             service_name: Optional service name to filter by
 
         Returns:
-            List of supported slide type identifiers
+            List of supported slide type identifiers. Without a service name,
+            each slide type is listed once even if several services declare it.
         """
+        self._ensure_initialized()
         if service_name:
-            service = self._services.get(service_name)
-            return service.slide_types if service else []
+            service = self._services.get(service_name) or self._aliases.get(service_name)
+            return list(service.slide_types) if service else []
 
         # Return all slide types from all enabled services
-        all_types = []
-        for config in self._services.values():
-            if config.enabled:
-                all_types.extend(config.slide_types)
-        return all_types
+        return list(self._supported_slide_types)
 
-    def route_slide(self, slide_type: str) -> Optional[Dict[str, Any]]:
+    def route_slide(self, slide_type: str) -> Optional[Mapping[str, Any]]:
         """
         Get routing information for a slide type.
 
@@ -426,41 +529,19 @@ class ServiceRegistry:
             slide_type: Slide type identifier
 
         Returns:
-            Dict with routing info:
+            Mapping with routing info:
                 - service_name: Name of the service
                 - service_config: ServiceConfig object
                 - endpoint_name: Recommended endpoint name
                 - full_url: Full endpoint URL (if available)
+            The mapping is precomputed, shared between calls and read-only;
+            copy it with dict() to modify.
         """
-        service_name = self._slide_type_map.get(slide_type)
-        if not service_name:
-            logger.error(f"Cannot route slide type '{slide_type}': no service mapping")
-            return None
-
-        service = self._services.get(service_name)
-        if not service or not service.enabled:
-            logger.error(
-                f"Cannot route slide type '{slide_type}': "
-                f"service '{service_name}' not available"
-            )
-            return None
-
-        # Determine endpoint name based on service type
-        endpoint_name = self._get_default_endpoint(service_name, slide_type)
-        full_url = None
-
-        if endpoint_name:
-            endpoint = service.endpoints.get(endpoint_name)
-            if endpoint:
-                full_url = f"{service.base_url}{endpoint.path}"
-
-        return {
-            "service_name": service_name,
-            "service_config": service,
-            "endpoint_name": endpoint_name,
-            "full_url": full_url,
-            "slide_type": slide_type
-        }
+        self._ensure_initialized()
+        routing = self._route_cache.get(slide_type)
+        if routing is None:
+            logger.error("Cannot route slide type '%s': no service mapping", slide_type)
+        return routing
 
     def _get_default_endpoint(self, service_name: str, slide_type: str) -> Optional[str]:
         """
@@ -483,10 +564,6 @@ class ServiceRegistry:
         elif service_name == "illustrator_service":
             return slide_type  # "pyramid" -> "pyramid" endpoint
 
-        # Hero Service: Endpoint name is slide type without "hero_" prefix
-        elif service_name == "hero_service":
-            return slide_type.replace("hero_", "")
-
         return None
 
     def get_service_info(self, service_name: str) -> Optional[Dict[str, Any]]:
@@ -499,16 +576,29 @@ class ServiceRegistry:
         Returns:
             Dict with service details or None if not found
         """
+        self._ensure_initialized()
         service = self._services.get(service_name)
-        if not service:
-            return None
+        if service is None:
+            alias = self._aliases.get(service_name)
+            if alias is None:
+                return None
+            target = self._services[alias.target]
+            return {
+                "name": service_name,
+                "enabled": target.enabled,
+                "base_url": target.base_url,
+                "version": target.version,
+                "slide_types": list(alias.slide_types),
+                "endpoints": list(alias.endpoint_map.keys()),
+                "health_endpoint": target.health_endpoint
+            }
 
         return {
             "name": service_name,
             "enabled": service.enabled,
             "base_url": service.base_url,
             "version": service.version,
-            "slide_types": service.slide_types,
+            "slide_types": list(service.slide_types),
             "endpoints": list(service.endpoints.keys()),
             "health_endpoint": service.health_endpoint
         }
@@ -520,18 +610,30 @@ class ServiceRegistry:
         Returns:
             Dict mapping service names to service info dicts
         """
+        self._ensure_initialized()
         return {
             name: self.get_service_info(name)
-            for name in self._services.keys()
+            for name in (*self._services, *self._aliases)
         }
 
 
+@lru_cache(maxsize=1)
+def get_service_registry() -> ServiceRegistry:
+    """
+    Get the process-wide ServiceRegistry instance.
+
+    Returns:
+        ServiceRegistry instance
+    """
+    return ServiceRegistry()
+
+
 # Example usage and testing
 if __name__ == "__main__":
     print("Service Registry - Multi-Service Integration (v3.4)")
     print("=" * 80)
 
-    registry = ServiceRegistry()
+    registry = get_service_registry()
 
     print("\n📋 Registered Services:")
     for service_name in registry.get_enabled_services():
@@ -549,7 +651,7 @@ if __name__ == "__main__":
             print(f"  {slide_type:25s} → {routing['service_name']:20s} ({routing['endpoint_name']})")
 
     print("\n\n📊 Service Statistics:")
-    print(f"  Total services: {len(registry._services)}")
+    print(f"  Total services: {len(registry.get_all_services_info())}")
     print(f"  Enabled services: {len(registry.get_enabled_services())}")
     print(f"  Total slide types: {len(registry.get_supported_slide_types())}")
 